@@ -0,0 +1,96 @@
+"""Column-oriented view of cluster information used for filtering and grouping."""
+
+from typing import Any, Dict, List, Sequence
+
+
+class ClusterTable:
+    """
+    Structure-of-arrays projection of cluster info dicts.
+
+    The fields the tools filter and group by are stored as parallel lists,
+    so a group-by is a ``Counter`` over one column instead of a walk over
+    every nested dict. Row ``i`` of each column describes ``infos[i]``.
+
+    Lowercased copies of the filterable columns are built once so the
+    case-insensitive filters don't re-normalize strings on every call, and
+    rows are indexed by platform (only a handful of distinct values) and by
+    owner.
+    """
+
+    __slots__ = (
+        "infos", "names", "platforms", "regions", "states", "owners", "provisioned",
+        "names_lc", "platforms_lc", "regions_lc", "states_lc", "owners_lc", "platform_index",
+        "owner_index",
+    )
+
+    def __init__(self, infos: List[Dict[str, Any]]):
+        """
+        Build the columns from cluster info dicts.
+
+        Args:
+            infos: Dicts produced by extract_cluster_info / extract_ibm_cluster_info
+        """
+        self.infos = infos
+        self.names: List[str] = [info.get("name", "") for info in infos]
+        self.platforms: List[str] = [info.get("platform", "") for info in infos]
+        self.regions: List[str] = [info.get("region", "") for info in infos]
+        self.states: List[str] = [info.get("state", "") for info in infos]
+        self.owners: List[str] = [info.get("owner", "") for info in infos]
+        # Claims without a cluster deployment yet have no platform/state
+        self.provisioned: List[bool] = ["state" in info for info in infos]
+
+        self.names_lc: List[str] = [name.lower() for name in self.names]
+        self.platforms_lc: List[str] = [(platform or "").lower() for platform in self.platforms]
+        self.regions_lc: List[str] = [region.lower() for region in self.regions]
+        self.states_lc: List[str] = [state.lower() for state in self.states]
+        self.owners_lc: List[str] = [owner.lower() for owner in self.owners]
+
+        self.platform_index: Dict[str, List[int]] = {}
+        for row, platform in enumerate(self.platforms_lc):
+            self.platform_index.setdefault(platform, []).append(row)
+
+        # Rows without an owner label (e.g. IBM clusters) are left out
+        self.owner_index: Dict[str, List[int]] = {}
+        for row, owner in enumerate(self.owners_lc):
+            if owner:
+                self.owner_index.setdefault(owner, []).append(row)
+
+    def __len__(self) -> int:
+        return len(self.infos)
+
+    def rows_for_platform(self, platform_filter: str) -> Sequence[int]:
+        """
+        Get the rows whose platform contains the filter (case-insensitive).
+
+        Only the distinct platform values are scanned, not every row.
+
+        Args:
+            platform_filter: Platform substring, e.g. 'aws' or 'ibm'
+
+        Returns:
+            Matching row indices in table order
+        """
+        return self._rows_matching(self.platform_index, platform_filter)
+
+    def rows_for_owner(self, owner_filter: str) -> Sequence[int]:
+        """
+        Get the rows whose owner contains the filter (case-insensitive).
+
+        Only the distinct owners are scanned, not every row.
+
+        Args:
+            owner_filter: Owner substring, e.g. 'john' or 'John_Smith'
+
+        Returns:
+            Matching row indices in table order
+        """
+        return self._rows_matching(self.owner_index, owner_filter)
+
+    @staticmethod
+    def _rows_matching(index: Dict[str, List[int]], value_filter: str) -> Sequence[int]:
+        """Union the rows of every index key containing the filter, in table order."""
+        needle = value_filter.lower()
+        matches = [rows for value, rows in index.items() if needle in value]
+        if len(matches) == 1:
+            return matches[0]
+        return sorted(row for rows in matches for row in rows)
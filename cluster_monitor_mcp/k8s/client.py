@@ -2,53 +2,424 @@
 
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
-from typing import Dict, List, Optional, Any
+from cluster_monitor_mcp.k8s.watch import ResourceWatcher
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib3.util.retry import Retry
+import atexit
+import orjson
 import os
 import sys
+import threading
+import time
+
+# Default lifetime of cached list results, in seconds (override with HIVE_CACHE_TTL)
+DEFAULT_CACHE_TTL = 30.0
+
+# Items requested per LIST page; larger lists are walked with continue tokens
+LIST_PAGE_SIZE = 500
+
+# Failures that won't go away by retrying are cached for this long, in seconds
+# (not 401: refreshed credentials should take effect on the next call)
+NEGATIVE_CACHE_TTL = 300.0
+NEGATIVE_CACHE_STATUSES = (403, 404)
+
+# Transient failures are retried by urllib3 with exponential backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Connections kept per host; sized for the concurrent per-namespace fan-out
+CONNECTION_POOL_MAXSIZE = 32
+
+# Namespaces created by Hive for cluster pool clusters carry this label
+# (Hive's constants.ClusterPoolNameLabel)
+HIVE_NAMESPACE_SELECTOR = "hive.openshift.io/clusterpool-name"
+
+# Ask the API server for metadata only, falling back to full objects if unsupported
+PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
+
+# Namespace whose cluster claims are kept in memory by the claims watch
+CLAIMS_NAMESPACE = "rhoai"
+
+# Concurrent requests when fanning out per-namespace lists
+FANOUT_MAX_WORKERS = 16
+
+# One pool shared by all fan-out calls, so threads aren't created per tool call
+_FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=FANOUT_MAX_WORKERS, thread_name_prefix="hive-fanout")
+atexit.register(_FANOUT_EXECUTOR.shutdown, wait=False)
+
+
+class _CachedFailure(NamedTuple):
+    """Negatively cached API failure; a fresh ApiException is raised from it on every hit."""
+
+    status: int
+    reason: str
+
+
+class _TTLCache:
+    """Small thread-safe in-memory cache storing ``{key: (expiry, value)}``."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return ``(hit, value)`` for a key, dropping it if it has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expiry, value = entry
+            if time.monotonic() >= expiry:
+                del self._entries[key]
+                return False, None
+            return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value for the given TTL (defaults to the configured TTL)."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
 
 
 class HiveClusterClient:
     """Client for interacting with Hive cluster resources."""
     
-    def __init__(self, kubeconfig_path: Optional[str] = None, context: Optional[str] = None):
+    def __init__(
+        self,
+        kubeconfig_path: Optional[str] = None,
+        context: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        watch: Optional[bool] = None,
+    ):
         """
         Initialize the Hive cluster client.
         
         Args:
             kubeconfig_path: Path to the kubeconfig file (defaults to env var or /home/jstetina/.kube/hive.yaml)
             context: Kubernetes context to use (defaults to env var or hive-cluster)
+            cache_ttl: Seconds to reuse list results for (defaults to env var HIVE_CACHE_TTL or 30)
+            watch: Keep cluster deployments and claims in memory via background watches
+                (defaults to env var HIVE_WATCH, enabled unless set to 0/false)
         """
         self.kubeconfig_path = kubeconfig_path or os.environ.get("HIVE_KUBECONFIG", "/home/jstetina/.kube/hive.yaml")
         self.context = context or os.environ.get("HIVE_CONTEXT", "hive-cluster")
-        self._setup_client()
+        if cache_ttl is None:
+            cache_ttl = float(os.environ.get("HIVE_CACHE_TTL", DEFAULT_CACHE_TTL))
+        self._cache = _TTLCache(cache_ttl)
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+        if watch is None:
+            watch = os.environ.get("HIVE_WATCH", "1").lower() not in ("0", "false", "no")
+        self._watch_enabled = watch
+        self._cd_watcher: Optional[ResourceWatcher] = None
+        self._cd_watch_index: Tuple[int, Dict[str, List[Dict[str, Any]]]] = (-1, {})
+        self._claim_watcher: Optional[ResourceWatcher] = None
+        
+        # The kubeconfig is loaded on first API use (see _ensure_client)
+        self._setup_lock = threading.RLock()
+        self._ready = False
+        self._api_client: Optional[client.ApiClient] = None
+        self._core_v1: Optional[client.CoreV1Api] = None
+        self._custom_objects: Optional[client.CustomObjectsApi] = None
+        self._metadata_objects: Optional[client.CustomObjectsApi] = None
+    
+    def _ensure_client(self) -> None:
+        """Set up the API clients once, on first use."""
+        if not self._ready:
+            with self._setup_lock:
+                if not self._ready:
+                    self._setup_client()
+    
+    @property
+    def api_client(self) -> client.ApiClient:
+        """Shared ApiClient, created on first access."""
+        self._ensure_client()
+        return self._api_client
+    
+    @property
+    def core_v1(self) -> client.CoreV1Api:
+        """CoreV1Api bound to the shared ApiClient, created on first access."""
+        self._ensure_client()
+        return self._core_v1
+    
+    @property
+    def custom_objects(self) -> client.CustomObjectsApi:
+        """CustomObjectsApi bound to the shared ApiClient, created on first access."""
+        self._ensure_client()
+        return self._custom_objects
     
     def _setup_client(self):
         """Setup the Kubernetes client with the specified kubeconfig and context."""
-        # Load kubeconfig
-        config.load_kube_config(config_file=self.kubeconfig_path, context=self.context)
+        # Load kubeconfig into a private configuration; don't write refreshed
+        # credentials back to the kubeconfig file
+        configuration = client.Configuration()
+        config.load_kube_config(
+            config_file=self.kubeconfig_path,
+            context=self.context,
+            client_configuration=configuration,
+            persist_config=False,
+        )
+        
+        # Share one ApiClient (and its urllib3 connection pool) between the API
+        # groups so list calls reuse keep-alive TLS connections
+        configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+        # Retry throttling and server errors on reads (honours Retry-After)
+        configuration.retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        self._api_client = client.ApiClient(configuration)
+        # JSON lists compress very well; urllib3 transparently decodes gzip
+        self._api_client.set_default_header("Accept-Encoding", "gzip")
         
         # Initialize API clients
-        self.core_v1 = client.CoreV1Api()
-        self.custom_objects = client.CustomObjectsApi()
+        self._core_v1 = client.CoreV1Api(self._api_client)
+        self._custom_objects = client.CustomObjectsApi(self._api_client)
+        
+        # The generated list calls always ask for full objects, but default
+        # headers take precedence over them, so metadata-only lists go
+        # through a second ApiClient that asks for PartialObjectMetadata.
+        # It sends its requests through the shared connection pool.
+        metadata_api_client = client.ApiClient(configuration)
+        metadata_api_client.rest_client = self._api_client.rest_client
+        metadata_api_client.set_default_header("Accept-Encoding", "gzip")
+        metadata_api_client.set_default_header("Accept", PARTIAL_METADATA_ACCEPT)
+        self._metadata_objects = client.CustomObjectsApi(metadata_api_client)
+        self._ready = True
+        
+        if self._watch_enabled:
+            # Cluster deployments are read on every tool call; keep them in memory
+            self._cd_watcher = ResourceWatcher(
+                "clusterdeployments",
+                lambda: self._list_custom_objects_versioned("clusterdeployments"),
+                self.custom_objects.list_cluster_custom_object,
+                group="hive.openshift.io",
+                version="v1",
+                plural="clusterdeployments",
+            )
+            self._cd_watcher.start()
+            
+            # Claims are read on every tool call too, but only in one namespace
+            self._claim_watcher = ResourceWatcher(
+                "clusterclaims",
+                lambda: self._list_custom_objects_versioned("clusterclaims", CLAIMS_NAMESPACE),
+                self.custom_objects.list_namespaced_custom_object,
+                group="hive.openshift.io",
+                version="v1",
+                namespace=CLAIMS_NAMESPACE,
+                plural="clusterclaims",
+            )
+            self._claim_watcher.start()
+    
+    def invalidate(self) -> None:
+        """Flush all cached list results so the next call hits the API server."""
+        self._cache.clear()
+    
+    def check_connection(self) -> int:
+        """
+        Make one uncached request to the API server.
+        
+        Lists at most one cluster claim in CLAIMS_NAMESPACE, bypassing the
+        list cache and the watches, so a stale in-memory copy can't hide a
+        broken connection.
+        
+        Returns:
+            Number of cluster claims in CLAIMS_NAMESPACE, from the page's
+            remainingItemCount (or the cached claim list if the API server
+            doesn't report one)
+            
+        Raises:
+            ApiException: If the API server rejects the request
+        """
+        response = self.custom_objects.list_namespaced_custom_object(
+            group="hive.openshift.io",
+            version="v1",
+            namespace=CLAIMS_NAMESPACE,
+            plural="clusterclaims",
+            limit=1,
+            _preload_content=False,
+        )
+        # Reading the whole body also returns the connection to the pool
+        page = orjson.loads(response.data)
+        metadata = page.get("metadata") or {}
+        count = len(page.get("items") or [])
+        if "remainingItemCount" in metadata:
+            return count + metadata["remainingItemCount"]
+        if not metadata.get("continue"):
+            return count
+        return len(self.get_clusterclaims(namespace=CLAIMS_NAMESPACE))
+    
+    def _cached(self, key: Hashable, loader: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Return the cached list for a key, calling the loader on a miss.
+        
+        Concurrent misses for the same key share a single in-flight request.
+        Failed loads raise (for every waiting caller). 403/404 responses are
+        cached for NEGATIVE_CACHE_TTL as (status, reason) and raised again as
+        a new ApiException on later calls, so a missing permission doesn't
+        cost a round-trip on every tool call; other failures are not cached.
+        A shallow copy is returned so callers can't mutate the cached list.
+        """
+        hit, items = self._cache.get(key)
+        if hit:
+            return self._unwrap(items)
+        
+        with self._inflight_lock:
+            # Re-check: another caller may have just finished loading this key
+            hit, items = self._cache.get(key)
+            if hit:
+                return self._unwrap(items)
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not leader:
+            return list(future.result())
+        
+        try:
+            items = loader()
+            self._cache.set(key, items)
+            future.set_result(items)
+        except ApiException as e:
+            if e.status in NEGATIVE_CACHE_STATUSES:
+                self._cache.set(key, _CachedFailure(e.status, e.reason), ttl=NEGATIVE_CACHE_TTL)
+            future.set_exception(e)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return list(items)
+    
+    @staticmethod
+    def _unwrap(value: Any) -> List[Dict[str, Any]]:
+        """Copy a cached list, or raise a new ApiException for a cached failure."""
+        if isinstance(value, _CachedFailure):
+            raise ApiException(status=value.status, reason=value.reason)
+        return list(value)
+    
+    def _list_custom_objects(
+        self,
+        plural: str,
+        namespace: Optional[str] = None,
+        metadata_only: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        List Hive custom objects page by page, following continue tokens.
+        
+        Args:
+            plural: Resource plural (e.g. clusterdeployments)
+            namespace: Namespace to list in, or None for a cluster-wide list
+            metadata_only: Request PartialObjectMetadata (name, namespace, labels, ...)
+                instead of full objects
+            
+        Returns:
+            List of objects across all pages
+            
+        Raises:
+            ApiException: If any page request fails
+        """
+        items, _ = self._list_custom_objects_versioned(plural, namespace, metadata_only)
+        return items
+    
+    def _list_custom_objects_versioned(
+        self,
+        plural: str,
+        namespace: Optional[str] = None,
+        metadata_only: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Like _list_custom_objects, also returning the list resourceVersion to watch from."""
+        items: List[Dict[str, Any]] = []
+        page: Dict[str, Any] = {}
+        for page in self._iter_custom_object_pages(plural, namespace, metadata_only):
+            items.extend(page.get("items", []))
+        return items, page.get("metadata", {}).get("resourceVersion", "")
+    
+    def _iter_custom_object_pages(
+        self,
+        plural: str,
+        namespace: Optional[str] = None,
+        metadata_only: bool = False,
+        page_size: int = LIST_PAGE_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield raw LIST pages of Hive custom objects, following continue tokens.
+        
+        Pages are consistent reads rather than resourceVersion=0 reads from
+        the API server's watch cache: the watch cache may ignore limit and
+        return the whole list in one response, which would defeat paging.
+        Lists are rare once the watches have synced (only their initial list
+        and re-lists, plus the fallback paths), so bounded responses are
+        worth the etcd read.
+        
+        Args:
+            plural: Resource plural (e.g. clusterdeployments)
+            namespace: Namespace to list in, or None for a cluster-wide list
+            metadata_only: Request PartialObjectMetadata instead of full objects
+            page_size: Maximum items per page
+            
+        Raises:
+            ApiException: If any page request fails
+        """
+        api = self.custom_objects
+        if metadata_only:
+            api = self._metadata_objects
+        list_kwargs = {"group": "hive.openshift.io", "version": "v1", "plural": plural}
+        if namespace is None:
+            list_fn = api.list_cluster_custom_object
+        else:
+            list_fn = api.list_namespaced_custom_object
+            list_kwargs["namespace"] = namespace
+        
+        continue_token = None
+        while True:
+            page_kwargs: Dict[str, Any] = {}
+            if continue_token:
+                page_kwargs["_continue"] = continue_token
+            # Skip the generated client's json.loads + deserialize pass and
+            # decode the raw body with orjson instead
+            response = list_fn(limit=page_size, _preload_content=False, **list_kwargs, **page_kwargs)
+            page = orjson.loads(response.data)
+            yield page
+            continue_token = page.get("metadata", {}).get("continue")
+            if not continue_token:
+                return
     
     def get_clusterclaims(self, namespace: str = "rhoai") -> List[Dict[str, Any]]:
         """
         Get all cluster claims in the specified namespace.
         
+        Claims in CLAIMS_NAMESPACE are served from the claims watch once it
+        has synced; other namespaces (or no watch) use cached list calls.
+        
         Args:
             namespace: Namespace to search for cluster claims (default: rhoai)
             
         Returns:
             List of cluster claim objects
         """
+        watcher = self._claim_watcher
+        if namespace == CLAIMS_NAMESPACE and watcher is not None and watcher.synced:
+            return watcher.items()
+        
         try:
-            result = self.custom_objects.list_namespaced_custom_object(
-                group="hive.openshift.io",
-                version="v1",
-                namespace=namespace,
-                plural="clusterclaims"
+            return self._cached(
+                ("clusterclaims", namespace),
+                lambda: self._list_custom_objects("clusterclaims", namespace)
             )
-            return result.get("items", [])
         except ApiException as e:
             # Log the error to stderr so we can see what's happening
             import sys
@@ -56,30 +427,179 @@ class HiveClusterClient:
             sys.stderr.flush()
             return []
     
+    def get_clusterclaims_metadata(self, namespace: str = "rhoai") -> List[Dict[str, Any]]:
+        """
+        Get cluster claims in the specified namespace with metadata only (no spec/status).
+        
+        Much smaller responses for callers that only need names and labels.
+        Claims in CLAIMS_NAMESPACE are served from the claims watch once it
+        has synced (full objects, which include the metadata).
+        
+        Args:
+            namespace: Namespace to search for cluster claims (default: rhoai)
+            
+        Returns:
+            List of cluster claim objects containing (at least) metadata
+        """
+        watcher = self._claim_watcher
+        if namespace == CLAIMS_NAMESPACE and watcher is not None and watcher.synced:
+            return watcher.items()
+        
+        try:
+            return self._cached(
+                ("clusterclaims-metadata", namespace),
+                lambda: self._list_custom_objects("clusterclaims", namespace, metadata_only=True)
+            )
+        except ApiException as e:
+            sys.stderr.write(f"ERROR getting clusterclaims: {type(e).__name__}: {str(e)}\n")
+            sys.stderr.flush()
+            return []
+    
+    def _list_all_clusterdeployments(self) -> List[Dict[str, Any]]:
+        """List cluster deployments cluster-wide, raising ApiException on failure."""
+        if self._cd_watcher is not None and self._cd_watcher.synced:
+            return self._cd_watcher.items()
+        return self._cached(
+            ("clusterdeployments", None),
+            lambda: self._list_custom_objects("clusterdeployments")
+        )
+    
+    def _cd_index(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Get cluster-wide cluster deployments grouped by namespace.
+        
+        Returns:
+            Mapping of namespace to its cluster deployments, or None when the
+            cluster-wide list is not permitted or fails (403/404 responses are
+            negatively cached, so they aren't retried on every call)
+        """
+        watcher = self._cd_watcher
+        if watcher is not None and watcher.synced:
+            # Regroup only when the watch has applied new events
+            version = watcher.version
+            if self._cd_watch_index[0] != version:
+                self._cd_watch_index = (version, self._group_by_namespace(watcher.items()))
+            return self._cd_watch_index[1]
+        
+        key = ("clusterdeployments-by-namespace",)
+        hit, index = self._cache.get(key)
+        if hit:
+            return index
+        
+        try:
+            items = self._list_all_clusterdeployments()
+        except Exception as e:
+            # Any failure (not just a 403) means callers use namespaced lists
+            sys.stderr.write(f"Cluster-wide clusterdeployments list failed, using namespaced lists: {type(e).__name__}: {str(e)}\n")
+            sys.stderr.flush()
+            if isinstance(e, ApiException) and e.status in NEGATIVE_CACHE_STATUSES:
+                # Remember the fallback too, so the cached failure isn't
+                # re-raised and logged again on every call
+                self._cache.set(key, None, ttl=NEGATIVE_CACHE_TTL)
+            return None
+        
+        index = self._group_by_namespace(items)
+        self._cache.set(key, index)
+        return index
+    
+    @staticmethod
+    def _group_by_namespace(items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Bucket objects by metadata.namespace."""
+        grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for item in items:
+            metadata = item.get("metadata") or {}
+            grouped[metadata.get("namespace", "")].append(item)
+        return dict(grouped)
+    
+    def get_clusterdeployments_by_namespace(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all cluster deployments grouped by namespace using a single cluster-wide list.
+        Note: This requires cluster-wide permissions.
+        
+        Returns:
+            Mapping of namespace to cluster deployment objects (empty if not
+            permitted or the list failed)
+        """
+        index = self._cd_index()
+        if index is None:
+            return {}
+        return {ns: list(items) for ns, items in index.items()}
+    
     def get_clusterdeployments(self, namespace: str) -> List[Dict[str, Any]]:
         """
         Get all cluster deployments in the specified namespace.
         
+        Served from the cluster-wide list when it is available; a namespaced
+        list is only issued when the cluster-wide list is forbidden or fails.
+        
         Args:
             namespace: Namespace to search for cluster deployments
             
         Returns:
             List of cluster deployment objects
         """
+        index = self._cd_index()
+        if index is not None:
+            return list(index.get(namespace, []))
+        return self._get_namespaced_clusterdeployments(namespace)
+    
+    def _get_namespaced_clusterdeployments(self, namespace: str) -> List[Dict[str, Any]]:
+        """Get cluster deployments with a (cached) namespaced list, never the cluster-wide one."""
         try:
-            result = self.custom_objects.list_namespaced_custom_object(
-                group="hive.openshift.io",
-                version="v1",
-                namespace=namespace,
-                plural="clusterdeployments"
+            return self._cached(
+                ("clusterdeployments", namespace),
+                lambda: self._list_custom_objects("clusterdeployments", namespace)
             )
-            return result.get("items", [])
         except ApiException as e:
             # Log the error to stderr so we can see what's happening
             sys.stderr.write(f"ERROR getting clusters: {type(e).__name__}: {str(e)}\n")
             sys.stderr.flush()
             return []
     
+    def get_clusterdeployments_parallel(self, namespaces: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get cluster deployments for many namespaces concurrently.
+        
+        This is the fallback for when the cluster-wide list is unavailable, so
+        only namespaced lists are issued; the cluster-wide list is not retried
+        once per namespace. Each namespace is an independent request, so wall
+        time is bounded by the slowest request rather than the sum of all of
+        them. Requests run on the shared fan-out pool, which caps concurrency
+        at FANOUT_MAX_WORKERS.
+        
+        Args:
+            namespaces: Namespaces to search for cluster deployments
+            
+        Returns:
+            Mapping of namespace to its cluster deployment objects
+        """
+        unique_namespaces = list(dict.fromkeys(ns for ns in namespaces if ns))
+        if not unique_namespaces:
+            return {}
+        
+        results = _FANOUT_EXECUTOR.map(self._get_namespaced_clusterdeployments, unique_namespaces)
+        return dict(zip(unique_namespaces, results))
+    
+    def get_clusterclaims_and_deployments(
+        self, namespace: str = "rhoai"
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        Get cluster claims and cluster-wide deployments (grouped by namespace) concurrently.
+        
+        The two lists are independent, so the claims are fetched on the
+        fan-out pool while the deployments are fetched on the calling thread;
+        on a cold cache this costs one round-trip instead of two.
+        
+        Args:
+            namespace: Namespace to search for cluster claims (default: rhoai)
+        
+        Returns:
+            Tuple of (clusterclaims, deployments_by_namespace)
+        """
+        claims_future = _FANOUT_EXECUTOR.submit(self.get_clusterclaims, namespace)
+        deployments_by_namespace = self.get_clusterdeployments_by_namespace()
+        return claims_future.result(), deployments_by_namespace
+    
     def get_all_clusterdeployments(self) -> List[Dict[str, Any]]:
         """
         Get all cluster deployments across all namespaces.
@@ -88,43 +608,70 @@ class HiveClusterClient:
         Returns:
             List of cluster deployment objects
         """
-        try:
-            result = self.custom_objects.list_cluster_custom_object(
-                group="hive.openshift.io",
-                version="v1",
-                plural="clusterdeployments"
-            )
-            return result.get("items", [])
-        except ApiException as e:
+        # A cached 403 short-circuits here instead of re-asking the API server
+        index = self._cd_index()
+        if index is None:
             # If we don't have cluster-wide permissions, fall back to namespace-based approach
             return []
+        return [deployment for deployments in index.values() for deployment in deployments]
     
-    def get_namespaces(self, label_selector: Optional[str] = None) -> List[str]:
+    def get_namespaces(self, label_selector: Optional[str] = HIVE_NAMESPACE_SELECTOR) -> List[str]:
         """
-        Get all namespaces, optionally filtered by label selector.
+        Get namespaces, filtered server-side by label selector.
         
         Args:
-            label_selector: Label selector to filter namespaces
+            label_selector: Label selector to filter namespaces (default: namespaces
+                created by Hive cluster pools). Pass None to list every namespace.
             
         Returns:
             List of namespace names
         """
         try:
+            # Namespaces are listed unpaged, so serve them from the API
+            # server's watch cache instead of a quorum read from etcd
             if label_selector:
-                result = self.core_v1.list_namespace(label_selector=label_selector)
+                loader = lambda: [ns.metadata.name for ns in self.core_v1.list_namespace(label_selector=label_selector, resource_version="0").items]
             else:
-                result = self.core_v1.list_namespace()
-            return [ns.metadata.name for ns in result.items]
+                loader = lambda: [ns.metadata.name for ns in self.core_v1.list_namespace(resource_version="0").items]
+            return self._cached(("namespaces", label_selector), loader)
         except ApiException as e:
             # Log the error to stderr so we can see what's happening
             sys.stderr.write(f"ERROR getting clusters: {type(e).__name__}: {str(e)}\n")
             sys.stderr.flush()
             return []
     
+    def _pool_index(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Get every cluster pool keyed by (namespace, name) from one cluster-wide list.
+        
+        Returns:
+            Mapping of (namespace, name) to cluster pool, empty if the
+            cluster-wide list is not permitted or fails
+        """
+        key = ("clusterpools-by-name",)
+        hit, index = self._cache.get(key)
+        if hit:
+            return index
+        
+        try:
+            pools = self._cached(("clusterpools", None), lambda: self._list_custom_objects("clusterpools"))
+        except ApiException:
+            # Not permitted cluster-wide; get_clusterpool falls back to a single GET
+            return {}
+        
+        index = {}
+        for pool in pools:
+            metadata = pool.get("metadata") or {}
+            index[(metadata.get("namespace", ""), metadata.get("name", ""))] = pool
+        self._cache.set(key, index)
+        return index
+    
     def get_clusterpool(self, namespace: str, pool_name: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific cluster pool.
         
+        Looked up in the prefetched pool index; a GET is only issued on a miss.
+        
         Args:
             namespace: Namespace containing the cluster pool
             pool_name: Name of the cluster pool
@@ -132,6 +679,10 @@ class HiveClusterClient:
         Returns:
             Cluster pool object or None if not found
         """
+        pool = self._pool_index().get((namespace, pool_name))
+        if pool is not None:
+            return pool
+        
         try:
             result = self.custom_objects.get_namespaced_custom_object(
                 group="hive.openshift.io",
@@ -156,13 +707,10 @@ class HiveClusterClient:
             List of cluster pool objects
         """
         try:
-            result = self.custom_objects.list_namespaced_custom_object(
-                group="hive.openshift.io",
-                version="v1",
-                namespace=namespace,
-                plural="clusterpools"
+            return self._cached(
+                ("clusterpools", namespace),
+                lambda: self._list_custom_objects("clusterpools", namespace)
             )
-            return result.get("items", [])
         except ApiException as e:
             # Log the error to stderr so we can see what's happening
             sys.stderr.write(f"ERROR getting clusters: {type(e).__name__}: {str(e)}\n")
@@ -0,0 +1,149 @@
+"""Watch-backed in-memory store for Hive custom resources."""
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import sys
+import threading
+import time
+
+# Server-side watch timeout; the stream is re-opened from the last resourceVersion
+WATCH_TIMEOUT_SECONDS = 300
+
+# Client-side socket timeout, slightly above the server-side one: a half-open
+# connection would otherwise block the watch thread forever while still synced
+REQUEST_TIMEOUT_SECONDS = WATCH_TIMEOUT_SECONDS + 30
+
+# Delay before re-listing after an unexpected watch failure
+RETRY_DELAY_SECONDS = 5.0
+
+
+class ResourceWatcher:
+    """
+    Keep a local copy of a resource up to date with a list followed by a watch.
+
+    The initial list fills the store; ADDED/MODIFIED/DELETED events are then
+    applied in a background thread so readers never wait on the API server.
+    Readers should fall back to listing themselves until ``synced`` is True.
+    Listing or watching being forbidden stops the watcher for good.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        list_fn: Callable[[], Tuple[List[Dict[str, Any]], str]],
+        watch_fn: Callable[..., Any],
+        **watch_kwargs: Any,
+    ):
+        """
+        Initialize the watcher (call ``start`` to begin syncing).
+
+        Args:
+            name: Resource name used in log messages and the thread name
+            list_fn: Returns all current items and the list resourceVersion
+            watch_fn: Generated API list function to stream watch events from
+            watch_kwargs: Extra arguments for ``watch_fn`` (group, version, plural, ...)
+        """
+        self.name = name
+        self._list_fn = list_fn
+        self._watch_fn = watch_fn
+        self._watch_kwargs = watch_kwargs
+        self._store: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.version = 0
+
+    @property
+    def synced(self) -> bool:
+        """Whether the store reflects a completed list and a running watch."""
+        return self._synced.is_set() and not self._stopped.is_set()
+
+    def start(self) -> None:
+        """Start the background list/watch thread (no-op if already running)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"watch-{self.name}", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop applying events; readers fall back to listing."""
+        self._stopped.set()
+
+    def items(self) -> List[Dict[str, Any]]:
+        """Return a snapshot of the stored objects."""
+        with self._lock:
+            return list(self._store.values())
+
+    @staticmethod
+    def _key(obj: Dict[str, Any]) -> str:
+        metadata = obj.get("metadata") or {}
+        return f"{metadata.get('namespace', '')}/{metadata.get('name', '')}"
+
+    def _relist(self) -> str:
+        """Replace the store with a fresh list and return its resourceVersion."""
+        items, resource_version = self._list_fn()
+        with self._lock:
+            self._store = {self._key(item): item for item in items}
+            self.version += 1
+        return resource_version
+
+    def _apply(self, event_type: str, obj: Dict[str, Any]) -> None:
+        """Apply a single watch event to the store."""
+        key = self._key(obj)
+        with self._lock:
+            if event_type == "DELETED":
+                self._store.pop(key, None)
+            elif event_type in ("ADDED", "MODIFIED"):
+                self._store[key] = obj
+            else:
+                return
+            self.version += 1
+
+    def _run(self) -> None:
+        """List, then watch from the list's resourceVersion until stopped."""
+        resource_version = None
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._relist()
+                    self._synced.set()
+
+                w = watch.Watch()
+                for event in w.stream(
+                    self._watch_fn,
+                    resource_version=resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                    _request_timeout=REQUEST_TIMEOUT_SECONDS,
+                    allow_watch_bookmarks=True,
+                    **self._watch_kwargs
+                ):
+                    if self._stopped.is_set():
+                        w.stop()
+                        return
+                    obj = event.get("object")
+                    if isinstance(obj, dict):
+                        self._apply(event.get("type", ""), obj)
+                # Stream timed out normally; resume from the last seen version
+                resource_version = w.resource_version or resource_version
+            except ApiException as e:
+                # Not 401: expired credentials may be refreshed, so retry
+                # like any other failure
+                if e.status == 403:
+                    sys.stderr.write(f"Watch for {self.name} not permitted, falling back to list calls\n")
+                    sys.stderr.flush()
+                    self._stopped.set()
+                    return
+                if e.status != 410:
+                    sys.stderr.write(f"ERROR watching {self.name}: {type(e).__name__}: {str(e)}\n")
+                    sys.stderr.flush()
+                    self._synced.clear()
+                    time.sleep(RETRY_DELAY_SECONDS)
+                # resourceVersion expired (410) or unknown failure: re-list
+                resource_version = None
+            except Exception as e:
+                sys.stderr.write(f"ERROR watching {self.name}: {type(e).__name__}: {str(e)}\n")
+                sys.stderr.flush()
+                self._synced.clear()
+                time.sleep(RETRY_DELAY_SECONDS)
+                resource_version = None
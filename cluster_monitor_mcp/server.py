@@ -2,10 +2,24 @@
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
-from cluster_monitor_mcp.k8s.client import HiveClusterClient
+from cluster_monitor_mcp.inventory import ClusterTable
 from cluster_monitor_mcp import descriptions
-from typing import Optional, List, Dict, Any
+from collections import Counter, OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Callable, Tuple, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import asyncio
+import atexit
+import contextvars
+import functools
+import itertools
+import operator
 import os
+import threading
+
+if TYPE_CHECKING:
+    # Imported lazily in get_hive_client: the kubernetes package is slow to import
+    from cluster_monitor_mcp.k8s.client import HiveClusterClient
 
 # Disable DNS rebinding protection for Docker container networking
 transport_security = TransportSecuritySettings(
@@ -19,19 +33,175 @@ mcp = FastMCP('rhoai-cluster-monitor', transport_security=transport_security)
 os.environ.setdefault('UVICORN_HOST', '0.0.0.0')
 os.environ.setdefault('UVICORN_PORT', '8000')
 
+# Worker threads for blocking tool calls; tools mostly wait on the API server,
+# so allow more threads than asyncio's default pool (override with MCP_TOOL_THREADS)
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('MCP_TOOL_THREADS', 4 * (os.cpu_count() or 1))),
+    thread_name_prefix='mcp-tool',
+)
+atexit.register(_TOOL_EXECUTOR.shutdown, wait=False)
+
 # Global client instance
-_hive_client: Optional[HiveClusterClient] = None
+_hive_client: Optional["HiveClusterClient"] = None
+_hive_client_lock = threading.Lock()
+
+# Last value of each derived view, with the objects it was built from (see _derive)
+_derived: Dict[str, Tuple[Tuple[List[Any], ...], Any]] = {}
+
+T = TypeVar("T")
+
+
+# Sort key for cluster info dicts
+_NAME_KEY = operator.itemgetter("name")
 
+# Field paths read from every claim/deployment in the hot loops
+_NAME_PATH = ("metadata", "name")
+_CLAIM_NAMESPACE_PATH = ("spec", "namespace")
+_OWNER_PATH = ("metadata", "labels", "owner")
+
+
+def _safe_chain(obj: Any, path: tuple, default: Any = "") -> Any:
+    """
+    Follow a path of keys through nested dicts.
+    
+    Args:
+        obj: Kubernetes object (nested dicts)
+        path: Tuple of keys to follow, e.g. ("metadata", "name")
+        default: Value returned if any key is missing or a level is not a dict
+        
+    Returns:
+        The value at the end of the path, or default
+    """
+    try:
+        for key in path:
+            obj = obj[key]
+    except (KeyError, TypeError):
+        return default
+    return obj
+
+
+# Minimum bound on memoized cluster infos; least recently used entries are
+# evicted beyond it (see resize below for larger tables)
+_EXTRACT_MEMO_MAX = 4096
+
+
+def _memoize_by_version(extract):
+    """
+    Memoize an extractor on the (uid, resourceVersion) of its object arguments.
+    
+    A resourceVersion changes on every update, so a memoized result can never
+    be stale. Objects without uid/resourceVersion are always re-extracted.
+    Callers get a copy of the memoized dict and are free to mutate it.
+    
+    The memo is a bounded LRU. ``wrapper.resize(rows)`` grows the bound to
+    twice the number of objects a table build extracts, so one build never
+    evicts entries the next build will look up.
+    """
+    memo: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    lock = threading.Lock()
+    capacity = _EXTRACT_MEMO_MAX
+    
+    @functools.wraps(extract)
+    def wrapper(*objects: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        key = []
+        for obj in objects:
+            if obj is None:
+                key.append(None)
+                continue
+            metadata = obj.get("metadata") or {}
+            uid, resource_version = metadata.get("uid"), metadata.get("resourceVersion")
+            if not uid or not resource_version:
+                return extract(*objects)
+            key.append((uid, resource_version))
+        key = tuple(key)
+        
+        with lock:
+            info = memo.get(key)
+            if info is not None:
+                memo.move_to_end(key)
+        if info is None:
+            info = extract(*objects)
+            with lock:
+                memo[key] = info
+                while len(memo) > capacity:
+                    memo.popitem(last=False)
+        return dict(info)
+    
+    def resize(rows: int) -> None:
+        """Size the memo for table builds of the given number of objects."""
+        nonlocal capacity
+        capacity = max(_EXTRACT_MEMO_MAX, 2 * rows)
+    
+    wrapper.resize = resize
+    return wrapper
 
-def get_hive_client() -> HiveClusterClient:
+
+def _same_objects(old: Tuple[List[Any], ...], new: Tuple[List[Any], ...]) -> bool:
+    """Whether two tuples of lists hold the very same objects, in the same order."""
+    return len(old) == len(new) and all(
+        len(old_list) == len(new_list) and all(map(operator.is_, old_list, new_list))
+        for old_list, new_list in zip(old, new)
+    )
+
+
+def _derive(name: str, inputs: Tuple[List[Any], ...], build: Callable[[], T]) -> T:
+    """
+    Return the value last built for a view if its inputs haven't changed.
+    
+    Cached lists and watch stores hand out the same object dicts until the
+    data is refreshed, so comparing the inputs by identity notices exactly
+    the refreshes a view depends on: a view isn't rebuilt when unrelated data
+    is refreshed, nor rebuilt twice for one refresh. The inputs are kept
+    alongside the value, so their ids can't be reused by new objects.
+    
+    Args:
+        name: Name of the view
+        inputs: Lists of the objects the view is built from
+        build: Builds the view from the inputs
+        
+    Returns:
+        The memoized or newly built view
+    """
+    cached = _derived.get(name)
+    if cached is not None and _same_objects(cached[0], inputs):
+        return cached[1]
+    value = build()
+    _derived[name] = (inputs, value)
+    return value
+
+
+def get_hive_client() -> "HiveClusterClient":
     """Get or create the Hive cluster client."""
     global _hive_client
     if _hive_client is None:
-        _hive_client = HiveClusterClient()
+        # Tools run in worker threads; make sure only one client gets created
+        with _hive_client_lock:
+            if _hive_client is None:
+                from cluster_monitor_mcp.k8s.client import HiveClusterClient
+                _hive_client = HiveClusterClient()
     return _hive_client
 
 
-def get_all_cluster_data(client: HiveClusterClient) -> tuple:
+def _run_in_thread(func):
+    """
+    Turn a blocking tool function into an async one that runs in a worker thread.
+    
+    FastMCP calls sync tools directly on the event loop, so every Kubernetes
+    round-trip would stall all other requests; running the tool on
+    _TOOL_EXECUTOR lets concurrent tool calls proceed. The wrapped signature
+    is preserved for FastMCP's argument schema.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        # Same as asyncio.to_thread, but on the sized tool pool
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        return await loop.run_in_executor(_TOOL_EXECUTOR, call)
+    
+    return wrapper
+
+
+def get_all_cluster_data(client: "HiveClusterClient") -> tuple:
     """
     Fetch all cluster data in minimal API calls.
     Falls back to per-namespace calls if cluster-wide access is not available.
@@ -39,35 +209,90 @@ def get_all_cluster_data(client: HiveClusterClient) -> tuple:
     Returns:
         Tuple of (clusterclaims, deployments_by_namespace, ibm_clusters)
     """
-    clusterclaims = client.get_clusterclaims(namespace="rhoai")
-    
-    # Try cluster-wide fetch first (fast path)
-    all_deployments = client.get_all_clusterdeployments()
-    
-    # Build lookup map by namespace
-    deployments_by_namespace: Dict[str, Dict[str, Any]] = {}
+    # Try cluster-wide fetch first (fast path): one LIST, grouped by namespace
+    # in the client and cached alongside the list; claims are fetched alongside it
+    clusterclaims, all_deployments_by_namespace = client.get_clusterclaims_and_deployments(namespace="rhoai")
+    deployments_by_namespace: Dict[str, Dict[str, Any]] = {
+        ns: deps[0]
+        for ns, deps in all_deployments_by_namespace.items()
+        if ns and deps
+    }
     
-    if all_deployments:
-        # Cluster-wide access worked - build map from results
-        for dep in all_deployments:
-            ns = dep.get("metadata", {}).get("namespace", "")
-            if ns:
-                deployments_by_namespace[ns] = dep
+    if deployments_by_namespace:
+        # IBM clusters are directly in rhoai namespace, already part of the cluster-wide list
+        ibm_clusters = all_deployments_by_namespace.get("rhoai", [])
     else:
-        # Fall back to per-namespace calls (slow but works without cluster-wide perms)
-        for claim in clusterclaims:
-            cluster_namespace = claim.get("spec", {}).get("namespace", "")
-            if cluster_namespace and cluster_namespace not in deployments_by_namespace:
-                deps = client.get_clusterdeployments(namespace=cluster_namespace)
-                if deps:
-                    deployments_by_namespace[cluster_namespace] = deps[0]
-    
-    # IBM clusters are directly in rhoai namespace
-    ibm_clusters = client.get_clusterdeployments(namespace="rhoai")
+        # Fall back to per-namespace calls (issued concurrently, works without cluster-wide perms)
+        namespaces = [_safe_chain(claim, _CLAIM_NAMESPACE_PATH) for claim in clusterclaims]
+        namespaced_deployments = client.get_clusterdeployments_parallel(namespaces + ["rhoai"])
+        for cluster_namespace, deps in namespaced_deployments.items():
+            if deps:
+                deployments_by_namespace[cluster_namespace] = deps[0]
+        
+        # IBM clusters are directly in rhoai namespace, listed along with the others
+        ibm_clusters = namespaced_deployments.get("rhoai", [])
     
     return clusterclaims, deployments_by_namespace, ibm_clusters
 
 
+# Cluster deployment condition types that determine the cluster state when True
+_CONDITION_STATE_MAP = {
+    "Hibernating": "Hibernating",
+    "Ready": "Running",
+    "ProvisionStopped": "ProvisionStopped",
+    "Resuming": "Resuming",
+}
+
+
+def _state_from_conditions(conditions: List[Dict[str, Any]], power_state: str) -> str:
+    """
+    Determine the cluster state from its deployment conditions.
+    
+    Args:
+        conditions: The clusterdeployment status conditions
+        power_state: The clusterdeployment spec.powerState, used if no condition matches
+        
+    Returns:
+        State of the first True condition found in _CONDITION_STATE_MAP, else power_state
+    """
+    return next(
+        (
+            state
+            for condition in conditions
+            if condition.get("status") == "True"
+            and (state := _CONDITION_STATE_MAP.get(condition.get("type")))
+        ),
+        power_state,
+    )
+
+
+@functools.lru_cache(maxsize=2048)
+def _console_url_from_api(api_url: str) -> str:
+    """
+    Derive the OpenShift console URL from a cluster API URL.
+    
+    Example: https://api.my-cluster.aws.example.com:6443
+          -> https://console-openshift-console.apps.my-cluster.aws.example.com
+    
+    Args:
+        api_url: The clusterdeployment status.apiURL (or "N/A")
+        
+    Returns:
+        Console URL, or "N/A" if it can't be derived
+    """
+    if api_url == "N/A":
+        return "N/A"
+    try:
+        api_domain = urlsplit(api_url).hostname or ""  # api.my-cluster.aws.example.com
+    except (AttributeError, ValueError):
+        return "N/A"
+    cluster_domain = api_domain.partition(".")[2]  # my-cluster.aws.example.com
+    if not cluster_domain:
+        return "N/A"
+    return f"https://console-openshift-console.apps.{cluster_domain}"
+
+
+@_memoize_by_version
 def extract_cluster_info(clusterclaim: Dict[str, Any], clusterdeployment: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Extract relevant information from clusterclaim and clusterdeployment objects.
@@ -79,35 +304,42 @@ def extract_cluster_info(clusterclaim: Dict[str, Any], clusterdeployment: Option
     Returns:
         Dictionary with extracted cluster information
     """
-    claim_name = clusterclaim.get("metadata", {}).get("name", "unknown")
+    # Bind each top-level section once; `or {}` also covers explicit nulls
+    claim_metadata = clusterclaim.get("metadata") or {}
+    claim_spec = clusterclaim.get("spec") or {}
+    claim_status = clusterclaim.get("status") or {}
+    
+    claim_name = claim_metadata.get("name", "unknown")
     # Strip -claim suffix for cleaner display
     claim_name = claim_name.removesuffix("-claim")
-    claim_spec = clusterclaim.get("spec", {})
-    claim_status = clusterclaim.get("status", {})
     
     # The cluster namespace is in spec.namespace, not status.namespace
     cluster_namespace = claim_spec.get("namespace", "N/A")
     
     # Get owner from labels
-    claim_labels = clusterclaim.get("metadata", {}).get("labels", {})
+    claim_labels = claim_metadata.get("labels") or {}
     owner = claim_labels.get("owner", "")
     
+    # Pending reason comes from the first claim condition
+    claim_conditions = claim_status.get("conditions")
+    pending = claim_conditions[0].get("reason", "Unknown") if claim_conditions else "Unknown"
+    
     info = {
         "name": claim_name,
         "owner": owner,
         "pool": claim_spec.get("clusterPoolName", "N/A"),
         "namespace": "rhoai",  # Claims are always in rhoai namespace
         "cluster_namespace": cluster_namespace,
-        "pending": claim_status.get("conditions", [{}])[0].get("reason", "Unknown") if claim_status.get("conditions") else "Unknown",
+        "pending": pending,
     }
     
     if clusterdeployment:
-        cd_spec = clusterdeployment.get("spec", {})
-        cd_status = clusterdeployment.get("status", {})
-        cd_metadata = clusterdeployment.get("metadata", {})
+        cd_spec = clusterdeployment.get("spec") or {}
+        cd_status = clusterdeployment.get("status") or {}
+        cd_metadata = clusterdeployment.get("metadata") or {}
         
         # Extract platform and region from labels
-        labels = cd_metadata.get("labels", {})
+        labels = cd_metadata.get("labels") or {}
         platform = labels.get("hive.openshift.io/cluster-platform", "unknown")
         region = labels.get("hive.openshift.io/cluster-region", "unknown")
         version = labels.get("hive.openshift.io/version", "unknown")
@@ -115,44 +347,14 @@ def extract_cluster_info(clusterclaim: Dict[str, Any], clusterdeployment: Option
         # Get power state and provision status
         power_state = cd_spec.get("powerState", "Unknown")
         
-        # Try to determine actual state from conditions
-        conditions = cd_status.get("conditions", [])
-        state = "Unknown"
-        
-        # Check for specific conditions to determine state
-        for condition in conditions:
-            if condition.get("type") == "Hibernating" and condition.get("status") == "True":
-                state = "Hibernating"
-                break
-            elif condition.get("type") == "Ready" and condition.get("status") == "True":
-                state = "Running"
-                break
-            elif condition.get("type") == "ProvisionStopped" and condition.get("status") == "True":
-                state = "ProvisionStopped"
-                break
-            elif condition.get("type") == "Resuming" and condition.get("status") == "True":
-                state = "Resuming"
-                break
-        
-        # If we couldn't determine from conditions, use power state
-        if state == "Unknown":
-            state = power_state
+        # Determine actual state from conditions, falling back to power state
+        state = _state_from_conditions(cd_status.get("conditions") or [], power_state)
         
         # Get API URL
         api_url = cd_status.get("apiURL", "N/A")
         
         # Get console URL (derive from API URL)
-        console_url = "N/A"
-        if api_url != "N/A":
-            # Extract cluster domain from API URL
-            # Example: https://api.my-cluster.aws.example.com:6443
-            # -> https://console-openshift-console.apps.my-cluster.aws.example.com
-            try:
-                api_domain = api_url.split("//")[1].split(":")[0]  # api.my-cluster.aws.example.com
-                cluster_domain = ".".join(api_domain.split(".")[1:])  # my-cluster.aws.example.com
-                console_url = f"https://console-openshift-console.apps.{cluster_domain}"
-            except Exception:
-                pass
+        console_url = _console_url_from_api(api_url)
         
         info.update({
             "platform": platform,
@@ -169,6 +371,7 @@ def extract_cluster_info(clusterclaim: Dict[str, Any], clusterdeployment: Option
     return info
 
 
+@_memoize_by_version
 def extract_ibm_cluster_info(clusterdeployment: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract information from IBM cluster deployments (no pool).
@@ -179,12 +382,14 @@ def extract_ibm_cluster_info(clusterdeployment: Dict[str, Any]) -> Dict[str, Any
     Returns:
         Dictionary with extracted cluster information
     """
-    cd_metadata = clusterdeployment.get("metadata", {})
-    cd_spec = clusterdeployment.get("spec", {})
-    cd_status = clusterdeployment.get("status", {})
+    # Bind each top-level section once; `or {}` also covers explicit nulls
+    cd_metadata = clusterdeployment.get("metadata") or {}
+    cd_spec = clusterdeployment.get("spec") or {}
+    cd_status = clusterdeployment.get("status") or {}
     
     cluster_name = cd_metadata.get("name", "unknown")
-    labels = cd_metadata.get("labels", {})
+    cluster_namespace = cd_metadata.get("namespace", "rhoai")
+    labels = cd_metadata.get("labels") or {}
     
     # Extract platform and region from labels or spec
     platform = labels.get("hive.openshift.io/cluster-platform")
@@ -200,45 +405,20 @@ def extract_ibm_cluster_info(clusterdeployment: Dict[str, Any]) -> Dict[str, Any
     # Get power state
     power_state = cd_spec.get("powerState", "Unknown")
     
-    # Try to determine actual state from conditions
-    conditions = cd_status.get("conditions", [])
-    state = "Unknown"
-    
-    for condition in conditions:
-        if condition.get("type") == "Hibernating" and condition.get("status") == "True":
-            state = "Hibernating"
-            break
-        elif condition.get("type") == "Ready" and condition.get("status") == "True":
-            state = "Running"
-            break
-        elif condition.get("type") == "ProvisionStopped" and condition.get("status") == "True":
-            state = "ProvisionStopped"
-            break
-        elif condition.get("type") == "Resuming" and condition.get("status") == "True":
-            state = "Resuming"
-            break
-    
-    if state == "Unknown":
-        state = power_state
+    # Determine actual state from conditions, falling back to power state
+    state = _state_from_conditions(cd_status.get("conditions") or [], power_state)
     
     # Get API URL
     api_url = cd_status.get("apiURL", "N/A")
     
     # Get console URL
-    console_url = "N/A"
-    if api_url != "N/A":
-        try:
-            api_domain = api_url.split("//")[1].split(":")[0]
-            cluster_domain = ".".join(api_domain.split(".")[1:])
-            console_url = f"https://console-openshift-console.apps.{cluster_domain}"
-        except Exception:
-            pass
+    console_url = _console_url_from_api(api_url)
     
     return {
         "name": cluster_name,
         "pool": "N/A (IBM - no pool)",
-        "namespace": cd_metadata.get("namespace", "rhoai"),
-        "cluster_namespace": cd_metadata.get("namespace", "rhoai"),
+        "namespace": cluster_namespace,
+        "cluster_namespace": cluster_namespace,
         "platform": platform,
         "region": region,
         "version": version,
@@ -252,115 +432,252 @@ def extract_ibm_cluster_info(clusterdeployment: Dict[str, Any]) -> Dict[str, Any
     }
 
 
-@mcp.tool(description=descriptions.LIST_ALL_CLUSTERS)
-def list_all_clusters(
-    platform_filter: Optional[str] = None,
-    name_filter: Optional[str] = None,
-    state_filter: Optional[str] = None,
-    region_filter: Optional[str] = None,
-    owner_filter: Optional[str] = None,
-    include_details: bool = False
-) -> Dict[str, Any]:
-    """Returns a structured response with cluster data."""
-    client = get_hive_client()
+def get_cluster_table(client: "HiveClusterClient") -> ClusterTable:
+    """
+    Get the ClusterTable for the client's current data.
+    
+    The table (with its owner and platform indexes) is only rebuilt when the
+    claims or deployments it is built from have been refreshed.
+    
+    Args:
+        client: The Hive cluster client
+        
+    Returns:
+        ClusterTable with one row per cluster
+    """
     clusterclaims, deployments_by_namespace, ibm_clusters = get_all_cluster_data(client)
+    return _derive(
+        "cluster_table",
+        (clusterclaims, list(deployments_by_namespace.values()), ibm_clusters),
+        lambda: build_cluster_table(clusterclaims, deployments_by_namespace, ibm_clusters),
+    )
+
+
+def build_cluster_table(
+    clusterclaims: List[Dict[str, Any]],
+    deployments_by_namespace: Dict[str, Dict[str, Any]],
+    ibm_clusters: List[Dict[str, Any]],
+) -> ClusterTable:
+    """
+    Join cluster claims with their deployments (plus IBM clusters) into a ClusterTable.
     
-    all_clusters = []
+    Args:
+        clusterclaims: Cluster claim objects
+        deployments_by_namespace: Cluster deployment per cluster namespace
+        ibm_clusters: IBM cluster deployments (no pools)
+        
+    Returns:
+        ClusterTable with one row per cluster sorted by name, including claims
+        without a deployment
+    """
+    infos = []
+    extract_cluster_info.resize(len(clusterclaims))
+    extract_ibm_cluster_info.resize(len(ibm_clusters))
     
     # Process regular clusters (with pools)
     for claim in clusterclaims:
-        cluster_namespace = claim.get("spec", {}).get("namespace", "")
+        cluster_namespace = _safe_chain(claim, _CLAIM_NAMESPACE_PATH)
         if cluster_namespace:
-            deployment = deployments_by_namespace.get(cluster_namespace)
-            if deployment:
-                cluster_info = extract_cluster_info(claim, deployment)
-                all_clusters.append(cluster_info)
-            else:
-                # No deployment found, include minimal info
-                cluster_info = extract_cluster_info(claim, None)
-                all_clusters.append(cluster_info)
+            infos.append(extract_cluster_info(claim, deployments_by_namespace.get(cluster_namespace)))
     
     # Process IBM clusters (no pools)
     for deployment in ibm_clusters:
-        cluster_info = extract_ibm_cluster_info(deployment)
-        all_clusters.append(cluster_info)
+        infos.append(extract_ibm_cluster_info(deployment))
     
-    # Apply filters
-    filtered_clusters = all_clusters
+    # Rows are kept in name order, so row-ordered selections come out sorted
+    infos.sort(key=_NAME_KEY)
+    return ClusterTable(infos)
+
+
+def get_owner_counts(client: "HiveClusterClient") -> Counter:
+    """
+    Count cluster claims per owner label.
     
-    if platform_filter:
-        platform_filter_lower = platform_filter.lower()
-        filtered_clusters = [c for c in filtered_clusters if platform_filter_lower in c.get("platform", "").lower()]
+    Only claim metadata is needed, so this reads the metadata-only claim
+    list; pending claims (no cluster namespace yet) are counted too. The
+    counts are only rebuilt when the claims have been refreshed.
     
-    if name_filter:
-        name_filter_lower = name_filter.lower()
-        filtered_clusters = [c for c in filtered_clusters if name_filter_lower in c.get("name", "").lower()]
+    Args:
+        client: The Hive cluster client
+        
+    Returns:
+        Counter of owner name to number of claims (claims without an owner are skipped)
+    """
+    clusterclaims = client.get_clusterclaims_metadata(namespace="rhoai")
+    return _derive(
+        "owner_counts",
+        (clusterclaims,),
+        lambda: Counter(
+            owner
+            for owner in (_safe_chain(claim, _OWNER_PATH) for claim in clusterclaims)
+            if owner
+        ),
+    )
+
+
+def get_name_indexes(client: "HiveClusterClient") -> Tuple[
+    List[Dict[str, Any]], List[Dict[str, Any]],
+    Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]
+]:
+    """
+    Get claims and IBM clusters along with lowercase exact-name indexes over them.
     
-    if state_filter:
-        state_filter_lower = state_filter.lower()
-        filtered_clusters = [c for c in filtered_clusters if state_filter_lower in c.get("state", "").lower()]
+    Claims are indexed by their name and by their name without the -claim
+    suffix, and separately by their cluster namespace; IBM cluster
+    deployments by their name. The indexes are only rebuilt when the claims
+    or IBM deployments have been refreshed.
     
-    if region_filter:
-        region_filter_lower = region_filter.lower()
-        filtered_clusters = [c for c in filtered_clusters if region_filter_lower in c.get("region", "").lower()]
+    Args:
+        client: The Hive cluster client
+        
+    Returns:
+        Tuple of (clusterclaims, ibm_clusters, claims_by_name, claims_by_namespace, ibm_by_name)
+    """
+    clusterclaims = client.get_clusterclaims(namespace="rhoai")
+    ibm_clusters = client.get_clusterdeployments(namespace="rhoai")
+    claims_by_name, claims_by_namespace, ibm_by_name = _derive(
+        "name_indexes",
+        (clusterclaims, ibm_clusters),
+        lambda: build_name_indexes(clusterclaims, ibm_clusters),
+    )
+    return clusterclaims, ibm_clusters, claims_by_name, claims_by_namespace, ibm_by_name
+
+
+def build_name_indexes(
+    clusterclaims: List[Dict[str, Any]],
+    ibm_clusters: List[Dict[str, Any]],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Build the lowercase exact-name indexes used by get_cluster_details.
     
-    if owner_filter:
-        owner_filter_lower = owner_filter.lower()
-        filtered_clusters = [c for c in filtered_clusters if owner_filter_lower in c.get("owner", "").lower()]
+    Args:
+        clusterclaims: Cluster claim objects
+        ibm_clusters: IBM cluster deployments (no pools)
+        
+    Returns:
+        Tuple of (claims_by_name, claims_by_namespace, ibm_by_name)
+    """
+    # setdefault keeps the first object per key, matching the scan order
+    claims_by_name: Dict[str, Dict[str, Any]] = {}
+    claims_by_namespace: Dict[str, Dict[str, Any]] = {}
+    for claim in clusterclaims:
+        claim_name_lower = _safe_chain(claim, _NAME_PATH).lower()
+        claims_by_name.setdefault(claim_name_lower, claim)
+        claims_by_name.setdefault(claim_name_lower.removesuffix("-claim"), claim)
+        cluster_namespace = _safe_chain(claim, _CLAIM_NAMESPACE_PATH)
+        if cluster_namespace:
+            claims_by_namespace.setdefault(cluster_namespace.lower(), claim)
     
-    # Sort by name
-    filtered_clusters.sort(key=lambda x: x.get("name", ""))
+    ibm_by_name: Dict[str, Dict[str, Any]] = {}
+    for deployment in ibm_clusters:
+        ibm_by_name.setdefault(_safe_chain(deployment, _NAME_PATH).lower(), deployment)
     
+    return claims_by_name, claims_by_namespace, ibm_by_name
+
+
+@mcp.tool(description=descriptions.LIST_ALL_CLUSTERS)
+@_run_in_thread
+def list_all_clusters(
+    platform_filter: Optional[str] = None,
+    name_filter: Optional[str] = None,
+    state_filter: Optional[str] = None,
+    region_filter: Optional[str] = None,
+    owner_filter: Optional[str] = None,
+    include_details: bool = False
+) -> Dict[str, Any]:
+    """Returns a structured response with cluster data."""
+    client = get_hive_client()
+    table = get_cluster_table(client)
+    
+    # Platform and owner filters are resolved through the table's indexes
+    rows = table.rows_for_platform(platform_filter) if platform_filter else range(len(table))
+    owner_rows = set(table.rows_for_owner(owner_filter)) if owner_filter else None
+    
+    # Lowercase each remaining filter once, then test every candidate row in
+    # a single pass against the table's pre-lowercased columns
+    name_filter_lower = name_filter.lower() if name_filter else None
+    state_filter_lower = state_filter.lower() if state_filter else None
+    region_filter_lower = region_filter.lower() if region_filter else None
+    names_lc, states_lc, regions_lc = table.names_lc, table.states_lc, table.regions_lc
+    
+    matching_rows = [
+        i
+        for i in rows
+        if (name_filter_lower is None or name_filter_lower in names_lc[i])
+        and (state_filter_lower is None or state_filter_lower in states_lc[i])
+        and (region_filter_lower is None or region_filter_lower in regions_lc[i])
+        and (owner_rows is None or i in owner_rows)
+    ]
+    
+    # Table rows are sorted by name and matching_rows is in row order, so the
+    # results need no re-sort
     if include_details:
+        filtered_clusters = [table.infos[i] for i in matching_rows]
         return {
             "total": len(filtered_clusters),
             "clusters": filtered_clusters
         }
     else:
-        # Just return list of names
-        return [c.get("name", "unknown") for c in filtered_clusters]
+        # Just return list of names, read from the name column without
+        # collecting the info dicts
+        names = table.names
+        return [names[i] for i in matching_rows]
         
 
 
 @mcp.tool(description=descriptions.GET_CLUSTER_DETAILS)
+@_run_in_thread
 def get_cluster_details(cluster_name: str) -> Dict[str, Any]:
     """Returns structured cluster details or error."""
     client = get_hive_client()
     
-    # Normalize the search name
+    # Normalize the search name; build the base-name prefix once, not per object
     search_name = cluster_name.lower().strip()
+    search_prefix = search_name + "-"
+    
+    clusterclaims, ibm_clusters, claims_by_name, claims_by_namespace, ibm_by_name = get_name_indexes(client)
+    
+    # First, try to find it in cluster claims: exact name (or name with -claim
+    # suffix) is a dict lookup, base-name prefix matches fall back to a scan
+    exact_claim = claims_by_name.get(search_name)
+    candidate_claims = itertools.chain(
+        [exact_claim] if exact_claim is not None else [],
+        (
+            claim for claim in clusterclaims
+            if _safe_chain(claim, _NAME_PATH).lower().startswith(search_prefix)
+        ),
+    )
     
-    # First, try to find it in cluster claims
-    clusterclaims = client.get_clusterclaims(namespace="rhoai")
+    for claim in candidate_claims:
+        cluster_namespace = _safe_chain(claim, _CLAIM_NAMESPACE_PATH)
+        if cluster_namespace:
+            deployments = client.get_clusterdeployments(namespace=cluster_namespace)
+            if deployments:
+                deployment = deployments[0]
+                cluster_info = extract_cluster_info(claim, deployment)
+                cluster_info["claim"] = claim
+                cluster_info["deployment"] = deployment
+                return cluster_info
+            else:
+                # Claim exists but no deployment yet
+                cluster_info = extract_cluster_info(claim, None)
+                cluster_info["claim"] = claim
+                return cluster_info
     
-    for claim in clusterclaims:
-        claim_name = claim.get("metadata", {}).get("name", "")
-        claim_name_lower = claim_name.lower()
-        
-        # Match exact name, with -claim suffix, or base name
-        if (claim_name_lower == search_name or 
-            claim_name_lower == f"{search_name}-claim" or
-            claim_name_lower.startswith(f"{search_name}-")):
-            
-            cluster_namespace = claim.get("spec", {}).get("namespace", "")
-            if cluster_namespace:
-                deployments = client.get_clusterdeployments(namespace=cluster_namespace)
-                if deployments:
-                    deployment = deployments[0]
-                    cluster_info = extract_cluster_info(claim, deployment)
-                    cluster_info["claim"] = claim
-                    cluster_info["deployment"] = deployment
-                    return cluster_info
-                else:
-                    # Claim exists but no deployment yet
-                    cluster_info = extract_cluster_info(claim, None)
-                    cluster_info["claim"] = claim
-                    return cluster_info
-    
-    # Check if it's a cluster namespace name (with random suffix)
-    for claim in clusterclaims:
-        cluster_namespace = claim.get("spec", {}).get("namespace", "")
-        if cluster_namespace.lower() == search_name or cluster_namespace.lower().startswith(f"{search_name}-"):
+    # Check if it's a cluster namespace name (with random suffix): the exact
+    # namespace is a dict lookup, prefix matches fall back to a scan
+    exact_namespace_claim = claims_by_namespace.get(search_name)
+    namespace_claims = itertools.chain(
+        [exact_namespace_claim] if exact_namespace_claim is not None else [],
+        (
+            claim for claim in clusterclaims
+            if _safe_chain(claim, _CLAIM_NAMESPACE_PATH).lower().startswith(search_prefix)
+        ),
+    )
+    
+    for claim in namespace_claims:
+        cluster_namespace = _safe_chain(claim, _CLAIM_NAMESPACE_PATH)
+        if cluster_namespace:
             deployments = client.get_clusterdeployments(namespace=cluster_namespace)
             if deployments:
                 deployment = deployments[0]
@@ -370,107 +687,62 @@ def get_cluster_details(cluster_name: str) -> Dict[str, Any]:
                 return cluster_info
     
     # Try IBM clusters (they don't use pools/claims)
-    ibm_clusters = client.get_clusterdeployments(namespace="rhoai")
-    for deployment in ibm_clusters:
-        ibm_name = deployment.get("metadata", {}).get("name", "")
-        if ibm_name.lower() == search_name or ibm_name.lower().startswith(f"{search_name}-"):
-            cluster_info = extract_ibm_cluster_info(deployment)
-            cluster_info["deployment"] = deployment
-            return cluster_info
+    deployment = ibm_by_name.get(search_name)
+    if deployment is None:
+        deployment = next(
+            (
+                ibm for ibm in ibm_clusters
+                if _safe_chain(ibm, _NAME_PATH).lower().startswith(search_prefix)
+            ),
+            None,
+        )
+    if deployment is not None:
+        cluster_info = extract_ibm_cluster_info(deployment)
+        cluster_info["deployment"] = deployment
+        return cluster_info
     
     return {"error": f"Cluster '{cluster_name}' not found", "hint": "Try using list_all_clusters to see available clusters."}
 
 
 @mcp.tool(description=descriptions.GET_CLUSTER_COUNT_BY_PLATFORM)
+@_run_in_thread
 def get_cluster_count_by_platform() -> Dict[str, Any]:
     """Returns structured platform statistics."""
     client = get_hive_client()
-    clusterclaims, deployments_by_namespace, ibm_clusters = get_all_cluster_data(client)
+    table = get_cluster_table(client)
     
-    platform_stats: Dict[str, Dict[str, int]] = {}
+    # Group-by over the platform/state columns of provisioned clusters
+    platform_state_counts = Counter(
+        (platform, state)
+        for platform, state, provisioned in zip(table.platforms, table.states, table.provisioned)
+        if provisioned
+    )
     
-    # Process regular clusters
-    for claim in clusterclaims:
-        cluster_namespace = claim.get("spec", {}).get("namespace", "")
-        if cluster_namespace:
-            deployment = deployments_by_namespace.get(cluster_namespace)
-            if deployment:
-                cluster_info = extract_cluster_info(claim, deployment)
-                
-                platform = cluster_info.get("platform", "unknown")
-                state = cluster_info.get("state", "Unknown")
-                
-                if platform not in platform_stats:
-                    platform_stats[platform] = {}
-                
-                if state not in platform_stats[platform]:
-                    platform_stats[platform][state] = 0
-                
-                platform_stats[platform][state] += 1
-    
-    # Process IBM clusters
-    for deployment in ibm_clusters:
-        cluster_info = extract_ibm_cluster_info(deployment)
-        platform = cluster_info.get("platform", "unknown")
-        state = cluster_info.get("state", "Unknown")
-        
-        if platform not in platform_stats:
-            platform_stats[platform] = {}
-        
-        if state not in platform_stats[platform]:
-            platform_stats[platform][state] = 0
-        
-        platform_stats[platform][state] += 1
+    platform_stats: Dict[str, Dict[str, int]] = defaultdict(dict)
+    for (platform, state), count in platform_state_counts.items():
+        platform_stats[platform][state] = count
     
     # Calculate totals
-    total_clusters = sum(
-        sum(states.values()) for states in platform_stats.values()
-    )
+    total_clusters = sum(platform_state_counts.values())
     
     return {
         "total": total_clusters,
-        "by_platform": platform_stats
+        "by_platform": dict(platform_stats)
     }
 
 
 @mcp.tool(description=descriptions.GET_CLUSTER_COUNT_BY_STATE)
+@_run_in_thread
 def get_cluster_count_by_state() -> Dict[str, Any]:
     """Returns structured state statistics."""
     client = get_hive_client()
-    clusterclaims, deployments_by_namespace, ibm_clusters = get_all_cluster_data(client)
+    table = get_cluster_table(client)
     
-    state_stats: Dict[str, List[str]] = {}
-    
-    # Process regular clusters
-    for claim in clusterclaims:
-        cluster_namespace = claim.get("spec", {}).get("namespace", "")
-        if cluster_namespace:
-            deployment = deployments_by_namespace.get(cluster_namespace)
-            if deployment:
-                cluster_info = extract_cluster_info(claim, deployment)
-                
-                state = cluster_info.get("state", "Unknown")
-                name = cluster_info.get("name", "unknown")
-                
-                if state not in state_stats:
-                    state_stats[state] = []
-                
-                state_stats[state].append(name)
-    
-    # Process IBM clusters
-    for deployment in ibm_clusters:
-        cluster_info = extract_ibm_cluster_info(deployment)
-        state = cluster_info.get("state", "Unknown")
-        name = cluster_info.get("name", "unknown")
-        
-        if state not in state_stats:
-            state_stats[state] = []
-        
-        state_stats[state].append(name)
-    
-    # Sort clusters within each state
-    for state in state_stats:
-        state_stats[state] = sorted(state_stats[state])
+    state_stats: Dict[str, List[str]] = defaultdict(list)
+    # Table rows are in name order, so each state's cluster list comes out sorted
+    for name, state, provisioned in zip(table.names, table.states, table.provisioned):
+        if provisioned:
+            state_stats[state].append(name)
     
     # Calculate totals
     total_clusters = sum(len(clusters) for clusters in state_stats.values())
@@ -485,19 +757,13 @@ def get_cluster_count_by_state() -> Dict[str, Any]:
 
 
 @mcp.tool(description=descriptions.GET_CLUSTER_OWNERS)
+@_run_in_thread
 def get_cluster_owners() -> Dict[str, Any]:
     """Returns a list of all unique cluster owners with their cluster counts."""
     client = get_hive_client()
     
-    # Get all cluster claims
-    clusterclaims = client.get_clusterclaims(namespace="rhoai")
-    
-    # Count clusters per owner
-    owner_counts: Dict[str, int] = {}
-    for claim in clusterclaims:
-        owner = claim.get("metadata", {}).get("labels", {}).get("owner", "")
-        if owner:
-            owner_counts[owner] = owner_counts.get(owner, 0) + 1
+    # Count clusters per owner (memoized until the claims change)
+    owner_counts = get_owner_counts(client)
     
     # Sort by count descending, then by name
     sorted_owners = sorted(
@@ -512,18 +778,20 @@ def get_cluster_owners() -> Dict[str, Any]:
 
 
 @mcp.tool(description=descriptions.TEST_HIVE_CONNECTION)
+@_run_in_thread
 def test_hive_connection() -> Dict[str, Any]:
     """Returns structured connection test result."""
     try:
         client = get_hive_client()
         
-        # Try to get cluster version
-        clusterclaims = client.get_clusterclaims(namespace="rhoai")
+        # Hit the API server directly; cached lists and the watches would
+        # answer even after the connection has gone away
+        cluster_claims_count = client.check_connection()
         
         return {
             "success": True,
             "message": "Successfully connected to Hive cluster",
-            "cluster_claims_count": len(clusterclaims)
+            "cluster_claims_count": cluster_claims_count
         }
     except Exception as e:
         return {
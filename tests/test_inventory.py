@@ -0,0 +1,76 @@
+"""Tests for the column-oriented ClusterTable."""
+
+from cluster_monitor_mcp.inventory import ClusterTable
+
+
+def _info(name, platform=None, region=None, state=None, owner=""):
+    info = {"name": name, "owner": owner}
+    if state is not None:
+        info.update({"platform": platform, "region": region, "state": state})
+    return info
+
+
+INFOS = [
+    _info("alpha", "aws", "us-east-1", "Running", owner="Alice"),
+    _info("beta", "gcp", "europe-west1", "Hibernating", owner="bob"),
+    _info("gamma", owner="alice"),
+    _info("ibm-one", "ibmcloud", "us-south", "Running"),
+]
+
+
+def test_columns_follow_rows():
+    table = ClusterTable(INFOS)
+    assert len(table) == 4
+    assert table.infos is INFOS
+    assert table.names == ["alpha", "beta", "gamma", "ibm-one"]
+    assert table.platforms == ["aws", "gcp", "", "ibmcloud"]
+    assert table.states == ["Running", "Hibernating", "", "Running"]
+    assert table.owners == ["Alice", "bob", "alice", ""]
+
+
+def test_provisioned_marks_rows_with_a_deployment():
+    table = ClusterTable(INFOS)
+    assert table.provisioned == [True, True, False, True]
+
+
+def test_empty_table():
+    table = ClusterTable([])
+    assert len(table) == 0
+    assert table.names == []
+
+
+def test_lowercased_columns():
+    table = ClusterTable([_info("Alpha", "AWS", "US-East-1", "Running", owner="Alice")])
+    assert table.names_lc == ["alpha"]
+    assert table.platforms_lc == ["aws"]
+    assert table.regions_lc == ["us-east-1"]
+    assert table.states_lc == ["running"]
+    assert table.owners_lc == ["alice"]
+
+
+def test_platform_index_groups_rows():
+    table = ClusterTable(INFOS)
+    assert table.platform_index == {"aws": [0], "gcp": [1], "": [2], "ibmcloud": [3]}
+
+
+def test_rows_for_platform_matches_substrings_case_insensitively():
+    table = ClusterTable(INFOS + [_info("zeta", "IBMCloud", "eu-de", "Hibernating")])
+    assert list(table.rows_for_platform("AWS")) == [0]
+    assert list(table.rows_for_platform("ibm")) == [3, 4]
+    # "c" is in gcp and ibmcloud; rows come back in table order
+    assert list(table.rows_for_platform("c")) == [1, 3, 4]
+    assert list(table.rows_for_platform("azure")) == []
+
+
+def test_owner_index_skips_rows_without_owner():
+    table = ClusterTable(INFOS)
+    # Owners differing only in case share one key
+    assert table.owner_index == {"alice": [0, 2], "bob": [1]}
+
+
+def test_rows_for_owner_matches_substrings_case_insensitively():
+    table = ClusterTable(INFOS)
+    assert list(table.rows_for_owner("ALICE")) == [0, 2]
+    assert list(table.rows_for_owner("b")) == [1]
+    assert list(table.rows_for_owner("o")) == [1]
+    assert list(table.rows_for_owner("carol")) == []
@@ -0,0 +1,380 @@
+"""Tests for the Hive list cache, the namespaced fallback and the resource watcher."""
+
+from cluster_monitor_mcp.k8s import client as hive_client
+from cluster_monitor_mcp.k8s import watch as hive_watch
+from cluster_monitor_mcp.k8s.client import HiveClusterClient
+from cluster_monitor_mcp.k8s.watch import ResourceWatcher
+from kubernetes.client.rest import ApiException
+from types import SimpleNamespace
+import orjson
+import pytest
+import threading
+import time
+
+
+def _obj(namespace, name, **extra):
+    return {"metadata": {"namespace": namespace, "name": name}, **extra}
+
+
+@pytest.fixture
+def hive():
+    """Client that never loads a kubeconfig or starts watches."""
+    hc = HiveClusterClient(kubeconfig_path="unused", context="unused", cache_ttl=30, watch=False)
+    hc._ready = True
+    return hc
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manually advanced monotonic clock for the list cache."""
+    now = [1000.0]
+    monkeypatch.setattr(hive_client, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+# --- Single-flight list cache ---
+
+def test_concurrent_misses_share_one_request(hive):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return [_obj("ns", "a")]
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(hive._cached("key", loader))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    assert started.wait(5)
+    # Give the other callers time to find the in-flight request
+    time.sleep(0.1)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert results == [[_obj("ns", "a")]] * 8
+    # Every caller gets its own copy of the cached list
+    assert len({id(r) for r in results}) == 8
+    assert not hive._inflight
+
+
+def test_concurrent_misses_share_one_failure(hive):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        raise ApiException(status=500, reason="Internal Server Error")
+
+    errors = []
+
+    def call():
+        try:
+            hive._cached("key", loader)
+        except ApiException as e:
+            errors.append(e.status)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    assert started.wait(5)
+    time.sleep(0.1)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert errors == [500] * 4
+
+
+def test_invalidate_flushes_cached_lists(hive):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [_obj("ns", "a")]
+
+    hive._cached("key", loader)
+    hive._cached("key", loader)
+    hive.invalidate()
+    hive._cached("key", loader)
+    assert len(calls) == 2
+
+
+# --- Negative caching ---
+
+def test_forbidden_is_cached_until_it_expires(hive, clock):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        raise ApiException(status=403, reason="Forbidden")
+
+    for _ in range(3):
+        with pytest.raises(ApiException) as excinfo:
+            hive._cached("key", loader)
+        assert (excinfo.value.status, excinfo.value.reason) == (403, "Forbidden")
+    assert len(calls) == 1
+
+    clock[0] += hive_client.NEGATIVE_CACHE_TTL + 1
+    with pytest.raises(ApiException):
+        hive._cached("key", loader)
+    assert len(calls) == 2
+
+
+def test_cached_failure_raises_a_new_exception(hive):
+    def loader():
+        raise ApiException(status=404, reason="Not Found")
+
+    with pytest.raises(ApiException) as first:
+        hive._cached("key", loader)
+    with pytest.raises(ApiException) as second:
+        hive._cached("key", loader)
+    assert second.value is not first.value
+    assert second.value.status == 404
+
+
+@pytest.mark.parametrize("status", [401, 500, 503])
+def test_other_failures_are_not_cached(hive, status):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        raise ApiException(status=status, reason="Error")
+
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            hive._cached("key", loader)
+    assert len(calls) == 2
+
+
+# --- Cluster-wide list vs namespaced fallback ---
+
+@pytest.fixture
+def api_calls(hive, monkeypatch):
+    """Record list calls; the cluster-wide list fails with ``api_calls.status`` if set."""
+    api = SimpleNamespace(status=None, calls=[])
+    deployments = {"ns-a": [_obj("ns-a", "a")], "ns-b": [_obj("ns-b", "b")]}
+
+    def list_custom_objects(plural, namespace=None, metadata_only=False):
+        api.calls.append(namespace)
+        if namespace is not None:
+            return list(deployments.get(namespace, []))
+        if api.status is not None:
+            raise ApiException(status=api.status, reason="Error")
+        return [item for items in deployments.values() for item in items]
+
+    monkeypatch.setattr(hive, "_list_custom_objects", list_custom_objects)
+    return api
+
+
+def test_cluster_wide_list_serves_namespaces(hive, api_calls):
+    assert hive.get_clusterdeployments("ns-a") == [_obj("ns-a", "a")]
+    assert hive.get_clusterdeployments("ns-b") == [_obj("ns-b", "b")]
+    assert api_calls.calls == [None]
+
+
+@pytest.mark.parametrize("status", [403, 500])
+def test_cluster_wide_failure_falls_back_to_namespaced_lists(hive, api_calls, status):
+    api_calls.status = status
+    assert hive.get_clusterdeployments("ns-a") == [_obj("ns-a", "a")]
+    assert hive.get_clusterdeployments_by_namespace() == {}
+    assert api_calls.calls[0] is None
+    assert "ns-a" in api_calls.calls
+
+
+def test_forbidden_cluster_wide_list_is_not_retried(hive, api_calls):
+    api_calls.status = 403
+    hive.get_clusterdeployments("ns-a")
+    hive.get_clusterdeployments("ns-b")
+    assert api_calls.calls.count(None) == 1
+
+
+def test_forbidden_cluster_wide_list_is_logged_once(hive, api_calls, capsys):
+    api_calls.status = 403
+    for namespace in ("ns-a", "ns-b", "ns-a"):
+        hive.get_clusterdeployments(namespace)
+    assert capsys.readouterr().err.count("Cluster-wide clusterdeployments list failed") == 1
+
+
+def test_server_error_retries_cluster_wide_list(hive, api_calls):
+    api_calls.status = 500
+    hive.get_clusterdeployments("ns-a")
+    api_calls.status = None
+    assert hive.get_clusterdeployments("ns-b") == [_obj("ns-b", "b")]
+    assert api_calls.calls == [None, "ns-a", None]
+
+
+@pytest.mark.parametrize("status", [403, 500])
+def test_parallel_fanout_only_issues_namespaced_lists(hive, api_calls, status):
+    api_calls.status = status
+    result = hive.get_clusterdeployments_parallel(["ns-a", "ns-b", "ns-a", ""])
+    assert result == {"ns-a": [_obj("ns-a", "a")], "ns-b": [_obj("ns-b", "b")]}
+    assert sorted(api_calls.calls) == ["ns-a", "ns-b"]
+
+
+# --- Connection check ---
+
+@pytest.mark.parametrize("metadata, expected", [
+    ({"continue": "x", "remainingItemCount": 41}, 42),
+    ({}, 1),
+    ({"continue": "x"}, 2),
+])
+def test_check_connection_counts_claims(hive, monkeypatch, metadata, expected):
+    requests = []
+
+    def list_namespaced_custom_object(**kwargs):
+        requests.append(kwargs)
+        return SimpleNamespace(data=orjson.dumps({"metadata": metadata, "items": [_obj("rhoai", "a")]}))
+
+    hive._custom_objects = SimpleNamespace(list_namespaced_custom_object=list_namespaced_custom_object)
+    monkeypatch.setattr(hive, "_list_custom_objects", lambda *args, **kwargs: [_obj("rhoai", "a"), _obj("rhoai", "b")])
+
+    assert hive.check_connection() == expected
+    assert hive.check_connection() == expected
+    # Every check reaches the API server, even when the claim list is cached
+    assert len(requests) == 2
+    assert requests[0]["limit"] == 1
+
+
+# --- Resource watcher ---
+
+class _FakeWatch:
+    """Stand-in for kubernetes.watch.Watch replaying scripted streams."""
+
+    streams = []
+    calls = []
+
+    def __init__(self):
+        self.resource_version = None
+
+    def stream(self, func, **kwargs):
+        _FakeWatch.calls.append(kwargs)
+        return _FakeWatch.streams.pop(0)(self)
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def fake_watch(monkeypatch):
+    _FakeWatch.streams = []
+    _FakeWatch.calls = []
+    monkeypatch.setattr(hive_watch, "watch", SimpleNamespace(Watch=_FakeWatch))
+    monkeypatch.setattr(hive_watch, "RETRY_DELAY_SECONDS", 0)
+    return _FakeWatch
+
+
+def _lister(*results):
+    """list_fn returning the given (items, resourceVersion) pairs in turn."""
+    results = list(results)
+    calls = []
+
+    def list_fn():
+        calls.append(1)
+        return results.pop(0)
+
+    list_fn.calls = calls
+    return list_fn
+
+
+def test_watcher_applies_events():
+    watcher = ResourceWatcher("things", _lister(([_obj("ns", "a", v=1)], "1")), None)
+    watcher._relist()
+
+    watcher._apply("ADDED", _obj("ns", "b", v=1))
+    watcher._apply("MODIFIED", _obj("ns", "a", v=2))
+    watcher._apply("DELETED", _obj("ns", "b"))
+    version = watcher.version
+    watcher._apply("BOOKMARK", _obj("", ""))
+
+    assert watcher.items() == [_obj("ns", "a", v=2)]
+    assert watcher.version == version
+
+
+def test_watcher_relists_on_gone(fake_watch):
+    list_fn = _lister(([_obj("ns", "a")], "1"), ([_obj("ns", "b")], "5"))
+    watcher = ResourceWatcher("things", list_fn, None, plural="things")
+
+    def expired(w):
+        yield {"type": "ADDED", "object": _obj("ns", "c")}
+        raise ApiException(status=410, reason="Gone")
+
+    def resumed(w):
+        assert watcher.items() == [_obj("ns", "b")]
+        watcher.stop()
+        yield {"type": "ADDED", "object": _obj("ns", "d")}
+
+    fake_watch.streams = [expired, resumed]
+    watcher._run()
+
+    assert len(list_fn.calls) == 2
+    assert [call["resource_version"] for call in fake_watch.calls] == ["1", "5"]
+    assert fake_watch.calls[0]["plural"] == "things"
+    # The event seen after stop() is not applied
+    assert watcher.items() == [_obj("ns", "b")]
+
+
+def test_watcher_resumes_from_last_version_after_timeout(fake_watch):
+    list_fn = _lister(([], "1"))
+    watcher = ResourceWatcher("things", list_fn, None)
+
+    def timed_out(w):
+        yield {"type": "ADDED", "object": _obj("ns", "a")}
+        w.resource_version = "7"
+
+    def resumed(w):
+        watcher.stop()
+        yield {"type": "ADDED", "object": _obj("ns", "b")}
+
+    fake_watch.streams = [timed_out, resumed]
+    watcher._run()
+
+    assert len(list_fn.calls) == 1
+    assert [call["resource_version"] for call in fake_watch.calls] == ["1", "7"]
+    assert watcher.items() == [_obj("ns", "a")]
+
+
+def test_watcher_stops_when_forbidden(fake_watch):
+    watcher = ResourceWatcher("things", _lister(([_obj("ns", "a")], "1")), None)
+
+    def forbidden(w):
+        raise ApiException(status=403, reason="Forbidden")
+        yield
+
+    fake_watch.streams = [forbidden]
+    watcher._run()
+
+    assert not watcher.synced
+    assert len(fake_watch.calls) == 1
+
+
+def test_watcher_relists_after_unauthorized(fake_watch):
+    list_fn = _lister(([_obj("ns", "a")], "1"), ([_obj("ns", "b")], "5"))
+    watcher = ResourceWatcher("things", list_fn, None)
+    synced_after_failure = []
+
+    def unauthorized(w):
+        raise ApiException(status=401, reason="Unauthorized")
+        yield
+
+    def resumed(w):
+        synced_after_failure.append(watcher.synced)
+        watcher.stop()
+        yield {"type": "ADDED", "object": _obj("ns", "c")}
+
+    fake_watch.streams = [unauthorized, resumed]
+    watcher._run()
+
+    assert len(list_fn.calls) == 2
+    assert synced_after_failure == [True]
+    assert [call["resource_version"] for call in fake_watch.calls] == ["1", "5"]
+    assert watcher.items() == [_obj("ns", "b")]
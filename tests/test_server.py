@@ -0,0 +1,591 @@
+"""Tests for the server-side cluster views built from Hive objects."""
+
+from cluster_monitor_mcp import server
+from cluster_monitor_mcp.k8s import client as hive_client
+from types import SimpleNamespace
+import asyncio
+import copy
+import pytest
+
+
+def _versioned(name, resource_version="1"):
+    return {"metadata": {"name": name, "uid": f"uid-{name}", "resourceVersion": resource_version}}
+
+
+def _claim(name, namespace=None, owner=None, reason=None):
+    claim = {
+        "metadata": {"name": name, "namespace": "rhoai", "labels": {}, "uid": f"uid-{name}", "resourceVersion": "1"},
+        "spec": {"clusterPoolName": "pool-a"},
+        "status": {},
+    }
+    if namespace:
+        claim["spec"]["namespace"] = namespace
+    if owner:
+        claim["metadata"]["labels"]["owner"] = owner
+    if reason:
+        claim["status"]["conditions"] = [{"type": "Pending", "reason": reason}]
+    return claim
+
+
+def _deployment(namespace, name, platform=None, region=None, version="4.16.0", power_state="Running",
+                conditions=(), api_url="N/A", spec_platform=None):
+    labels = {}
+    if platform:
+        labels["hive.openshift.io/cluster-platform"] = platform
+    if region:
+        labels["hive.openshift.io/cluster-region"] = region
+    if version:
+        labels["hive.openshift.io/version"] = version
+    deployment = {
+        "metadata": {"name": name, "namespace": namespace, "labels": labels, "uid": f"uid-{name}", "resourceVersion": "1"},
+        "spec": {"powerState": power_state},
+        "status": {"conditions": list(conditions), "apiURL": api_url, "infraID": f"{name}-infra"},
+    }
+    if spec_platform:
+        deployment["spec"]["platform"] = spec_platform
+    return deployment
+
+
+# Two claimed clusters, a claim still waiting for its deployment, a pending
+# claim without a cluster namespace, and two IBM clusters in rhoai
+CLAIMS = [
+    _claim("alpha-claim", "alpha-x1", owner="Alice", reason="ClusterClaimed"),
+    _claim("beta-claim", "beta-x2", owner="bob"),
+    _claim("gamma-claim", "gamma-x3", owner="alice", reason="NoClusters"),
+    _claim("delta-claim", owner="carol", reason="NoClusters"),
+]
+DEPLOYMENTS = [
+    _deployment(
+        "alpha-x1", "alpha-x1", platform="aws", region="us-east-1",
+        conditions=[{"type": "Hibernating", "status": "False"}, {"type": "Ready", "status": "True"}],
+        api_url="https://api.alpha.aws.example.com:6443",
+    ),
+    _deployment(
+        "beta-x2", "beta-x2", platform="gcp", region="europe-west1", power_state="Hibernating",
+        conditions=[{"type": "Hibernating", "status": "True"}],
+    ),
+    _deployment(
+        "rhoai", "ibm-one", platform="ibmcloud", region="us-south",
+        api_url="https://api.ibm-one.ibm.example.com:6443",
+    ),
+    _deployment(
+        "rhoai", "ibm-two", version=None, power_state="Hibernating",
+        spec_platform={"ibmcloud": {"region": "eu-de"}},
+    ),
+]
+
+
+class FakeHiveClient:
+    """
+    Stand-in for HiveClusterClient serving fixed objects.
+
+    Like the real client's cache and watches, every call returns a new list
+    holding the same object dicts until ``refresh`` replaces them. With
+    ``cluster_wide=False`` the cluster-wide deployment list comes back empty,
+    as it does when it is forbidden.
+    """
+
+    def __init__(self, claims=None, deployments=None, cluster_wide=True):
+        self.claims = copy.deepcopy(CLAIMS if claims is None else claims)
+        self.deployments = copy.deepcopy(DEPLOYMENTS if deployments is None else deployments)
+        self.cluster_wide = cluster_wide
+        self.calls = []
+
+    def refresh(self):
+        self.claims = copy.deepcopy(self.claims)
+        self.deployments = copy.deepcopy(self.deployments)
+
+    def _by_namespace(self):
+        grouped = {}
+        for deployment in self.deployments:
+            grouped.setdefault(deployment["metadata"]["namespace"], []).append(deployment)
+        return grouped
+
+    def get_clusterclaims(self, namespace="rhoai"):
+        return list(self.claims)
+
+    def get_clusterclaims_metadata(self, namespace="rhoai"):
+        return list(self.claims)
+
+    def get_clusterdeployments(self, namespace):
+        self.calls.append(("get_clusterdeployments", namespace))
+        return list(self._by_namespace().get(namespace, []))
+
+    def get_clusterdeployments_parallel(self, namespaces):
+        self.calls.append(("get_clusterdeployments_parallel", list(namespaces)))
+        grouped = self._by_namespace()
+        return {ns: list(grouped.get(ns, [])) for ns in dict.fromkeys(ns for ns in namespaces if ns)}
+
+    def get_clusterclaims_and_deployments(self, namespace="rhoai"):
+        self.calls.append(("get_clusterclaims_and_deployments", namespace))
+        return list(self.claims), self._by_namespace() if self.cluster_wide else {}
+
+
+def _call(tool, **kwargs):
+    """Run an async MCP tool function to completion."""
+    return asyncio.run(tool(**kwargs))
+
+
+@pytest.fixture
+def hive(monkeypatch):
+    """FakeHiveClient installed as the server's client."""
+    client = FakeHiveClient()
+    monkeypatch.setattr(server, "_hive_client", client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def fresh_views(monkeypatch):
+    """Start every test without memoized views."""
+    monkeypatch.setattr(server, "_derived", {})
+
+
+# --- Extraction memo ---
+
+@pytest.fixture
+def counted_extract(monkeypatch):
+    """Memoized extractor with a small bound that records every real extraction."""
+    monkeypatch.setattr(server, "_EXTRACT_MEMO_MAX", 8)
+    calls = []
+
+    def extract(obj):
+        calls.append(obj["metadata"]["name"])
+        return {"name": obj["metadata"]["name"]}
+
+    memoized = server._memoize_by_version(extract)
+    memoized.calls = calls
+    return memoized
+
+
+def test_memo_returns_copies(counted_extract):
+    obj = _versioned("a")
+    first = counted_extract(obj)
+    first["name"] = "changed"
+    assert counted_extract(obj) == {"name": "a"}
+    assert counted_extract.calls == ["a"]
+
+
+def test_memo_misses_on_new_resource_version(counted_extract):
+    counted_extract(_versioned("a", "1"))
+    counted_extract(_versioned("a", "2"))
+    assert counted_extract.calls == ["a", "a"]
+
+
+def test_memo_sized_for_rows_keeps_every_entry(counted_extract):
+    objects = [_versioned(f"c{i}") for i in range(20)]
+    counted_extract.resize(len(objects))
+    for _ in range(3):
+        for obj in objects:
+            counted_extract(obj)
+    assert len(counted_extract.calls) == 20
+
+
+def test_memo_evicts_least_recently_used(counted_extract):
+    objects = [_versioned(f"c{i}") for i in range(8)]
+    for obj in objects:
+        counted_extract(obj)
+    # Touch the oldest entry, then overflow the bound by one
+    counted_extract(objects[0])
+    counted_extract(_versioned("new"))
+    counted_extract(objects[0])
+    assert counted_extract.calls.count("c0") == 1
+    counted_extract(objects[1])
+    assert counted_extract.calls.count("c1") == 2
+
+
+# --- Derived views ---
+
+def test_derive_reuses_view_for_the_same_objects():
+    objects = [{"a": 1}, {"b": 2}]
+    builds = []
+    for _ in range(3):
+        # A new list holding the same objects, as cached lists are returned
+        server._derive("view", (list(objects),), lambda: builds.append(1) or len(builds))
+    assert builds == [1]
+
+
+def test_derive_rebuilds_once_per_refresh():
+    objects = [{"a": 1}]
+    builds = []
+
+    def build():
+        builds.append(1)
+        return len(builds)
+
+    assert server._derive("view", (list(objects),), build) == 1
+    refreshed = copy.deepcopy(objects)
+    assert server._derive("view", (list(refreshed),), build) == 2
+    assert server._derive("view", (list(refreshed),), build) == 2
+    assert server._derive("view", (list(refreshed) + [{"c": 3}],), build) == 3
+
+
+def test_derive_views_are_independent():
+    claims, deployments = [{"claim": 1}], [{"deployment": 1}]
+    builds = []
+    server._derive("claims", (claims,), lambda: builds.append("claims"))
+    server._derive("deployments", (deployments,), lambda: builds.append("deployments"))
+    # Refreshing the deployments leaves the claims view alone
+    server._derive("deployments", (copy.deepcopy(deployments),), lambda: builds.append("deployments"))
+    server._derive("claims", (list(claims),), lambda: builds.append("claims"))
+    assert builds == ["claims", "deployments", "deployments"]
+
+
+def test_owner_counts_include_pending_claims():
+    client = FakeHiveClient(
+        [
+            _claim("a-claim", "a-ns", owner="alice"),
+            _claim("b-claim", "b-ns", owner="alice"),
+            _claim("c-claim", owner="carol"),
+            _claim("d-claim", "d-ns"),
+        ],
+        [],
+    )
+    counts = server.get_owner_counts(client)
+    assert counts == {"alice": 2, "carol": 1}
+    assert server.get_owner_counts(client) is counts
+    client.refresh()
+    assert server.get_owner_counts(client) is not counts
+
+
+def test_cluster_table_rebuilds_once_per_cache_refresh(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(hive_client, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    objects = {
+        ("clusterclaims", "rhoai"): [_claim("a-claim", "a-ns", owner="alice")],
+        ("clusterdeployments", None): [{"metadata": {"name": "a", "namespace": "a-ns"}}],
+    }
+
+    def list_custom_objects(plural, namespace=None, metadata_only=False):
+        # Every list returns new dicts, like a real API response
+        return copy.deepcopy(objects.get((plural, namespace), []))
+
+    client = hive_client.HiveClusterClient(kubeconfig_path="unused", context="unused", cache_ttl=30, watch=False)
+    client._ready = True
+    monkeypatch.setattr(client, "_list_custom_objects", list_custom_objects)
+    builds = []
+    build_cluster_table = server.build_cluster_table
+    monkeypatch.setattr(server, "build_cluster_table", lambda *args: builds.append(1) or build_cluster_table(*args))
+
+    table = server.get_cluster_table(client)
+    assert server.get_cluster_table(client) is table
+    # Loading an unrelated list doesn't invalidate the table
+    server.get_owner_counts(client)
+    assert server.get_cluster_table(client) is table
+    assert len(builds) == 1
+
+    now[0] += 31
+    refreshed = server.get_cluster_table(client)
+    assert refreshed is not table
+    assert server.get_cluster_table(client) is refreshed
+    assert len(builds) == 2
+
+
+# --- Cluster table and grouped tools ---
+
+ALPHA_INFO = {
+    "name": "alpha",
+    "owner": "Alice",
+    "pool": "pool-a",
+    "namespace": "rhoai",
+    "cluster_namespace": "alpha-x1",
+    "pending": "ClusterClaimed",
+    "platform": "aws",
+    "region": "us-east-1",
+    "version": "4.16.0",
+    "state": "Running",
+    "power_state": "Running",
+    "api_url": "https://api.alpha.aws.example.com:6443",
+    "console_url": "https://console-openshift-console.apps.alpha.aws.example.com",
+    "infra_id": "alpha-x1-infra",
+    "cluster_id": "uid-alpha-x1",
+}
+
+IBM_TWO_INFO = {
+    "name": "ibm-two",
+    "pool": "N/A (IBM - no pool)",
+    "namespace": "rhoai",
+    "cluster_namespace": "rhoai",
+    "platform": "ibmcloud",
+    "region": "unknown",
+    "version": "unknown",
+    "state": "Hibernating",
+    "power_state": "Hibernating",
+    "api_url": "N/A",
+    "console_url": "N/A",
+    "infra_id": "ibm-two-infra",
+    "cluster_id": "uid-ibm-two",
+    "pending": "N/A (IBM)",
+}
+
+
+def test_list_all_clusters_lists_every_cluster_by_name(hive):
+    # The pending claim without a cluster namespace is left out
+    assert _call(server.list_all_clusters) == ["alpha", "beta", "gamma", "ibm-one", "ibm-two"]
+
+
+def test_list_all_clusters_details(hive):
+    result = _call(server.list_all_clusters, include_details=True)
+    assert result["total"] == 5
+    clusters = {info["name"]: info for info in result["clusters"]}
+    assert clusters["alpha"] == ALPHA_INFO
+    assert clusters["ibm-two"] == IBM_TWO_INFO
+    # A claim without a deployment yet only has the claim fields
+    assert clusters["gamma"] == {
+        "name": "gamma",
+        "owner": "alice",
+        "pool": "pool-a",
+        "namespace": "rhoai",
+        "cluster_namespace": "gamma-x3",
+        "pending": "NoClusters",
+    }
+
+
+def test_count_by_platform_skips_unprovisioned_claims(hive):
+    assert _call(server.get_cluster_count_by_platform) == {
+        "total": 4,
+        "by_platform": {
+            "aws": {"Running": 1},
+            "gcp": {"Hibernating": 1},
+            "ibmcloud": {"Running": 1, "Hibernating": 1},
+        },
+    }
+
+
+def test_count_by_state_lists_sorted_names(hive):
+    assert _call(server.get_cluster_count_by_state) == {
+        "total": 4,
+        "by_state": {
+            "Running": {"count": 2, "clusters": ["alpha", "ibm-one"]},
+            "Hibernating": {"count": 2, "clusters": ["beta", "ibm-two"]},
+        },
+    }
+
+
+def test_tools_share_one_cluster_table(hive, monkeypatch):
+    builds = []
+    build_cluster_table = server.build_cluster_table
+    monkeypatch.setattr(server, "build_cluster_table", lambda *args: builds.append(1) or build_cluster_table(*args))
+    _call(server.list_all_clusters)
+    _call(server.get_cluster_count_by_platform)
+    _call(server.get_cluster_count_by_state)
+    assert len(builds) == 1
+
+
+@pytest.mark.parametrize("filters, expected", [
+    ({"platform_filter": "AWS"}, ["alpha"]),
+    ({"platform_filter": "ibm"}, ["ibm-one", "ibm-two"]),
+    ({"platform_filter": "nope"}, []),
+    ({"name_filter": "TA"}, ["beta"]),
+    ({"state_filter": "running"}, ["alpha", "ibm-one"]),
+    ({"region_filter": "us"}, ["alpha", "ibm-one"]),
+    ({"platform_filter": "ibm", "state_filter": "hib"}, ["ibm-two"]),
+])
+def test_list_all_clusters_filters(hive, filters, expected):
+    assert _call(server.list_all_clusters, **filters) == expected
+
+
+@pytest.mark.parametrize("owner_filter, expected", [
+    ("ALICE", ["alpha", "gamma"]),
+    ("a", ["alpha", "gamma"]),
+    ("bob", ["beta"]),
+    # carol's claim is pending without a cluster namespace, so it isn't listed
+    ("carol", []),
+])
+def test_list_all_clusters_owner_filter(hive, owner_filter, expected):
+    assert _call(server.list_all_clusters, owner_filter=owner_filter) == expected
+
+
+def test_cluster_owners_counts_every_claim(hive):
+    assert _call(server.get_cluster_owners) == {
+        "total_owners": 4,
+        "owners": [
+            {"name": "Alice", "cluster_count": 1},
+            {"name": "alice", "cluster_count": 1},
+            {"name": "bob", "cluster_count": 1},
+            {"name": "carol", "cluster_count": 1},
+        ],
+    }
+
+
+# --- Cluster lookup by name ---
+
+@pytest.mark.parametrize("cluster_name", ["alpha", "ALPHA-claim", " alpha-claim "])
+def test_details_by_claim_name(hive, cluster_name):
+    details = _call(server.get_cluster_details, cluster_name=cluster_name)
+    assert {key: details[key] for key in ALPHA_INFO} == ALPHA_INFO
+    assert details["claim"]["metadata"]["name"] == "alpha-claim"
+    assert details["deployment"]["metadata"]["name"] == "alpha-x1"
+
+
+def test_details_for_claim_without_deployment(hive):
+    details = _call(server.get_cluster_details, cluster_name="gamma")
+    assert details["name"] == "gamma"
+    assert details["claim"]["metadata"]["name"] == "gamma-claim"
+    assert "deployment" not in details
+
+
+def test_details_by_base_name_prefix(monkeypatch):
+    client = FakeHiveClient(
+        CLAIMS + [_claim("omega-7f3k", "omega-x4", owner="dave")],
+        DEPLOYMENTS + [_deployment("omega-x4", "omega-x4", platform="aws", region="us-west-2")],
+    )
+    monkeypatch.setattr(server, "_hive_client", client)
+    details = _call(server.get_cluster_details, cluster_name="Omega")
+    assert details["name"] == "omega-7f3k"
+    assert details["cluster_namespace"] == "omega-x4"
+
+
+def test_details_prefers_exact_name_over_earlier_prefix_match(monkeypatch):
+    client = FakeHiveClient(
+        [_claim("kappa-old-claim", "kappa-x5"), _claim("kappa-claim", "kappa-x6")],
+        [_deployment("kappa-x5", "kappa-x5"), _deployment("kappa-x6", "kappa-x6")],
+    )
+    monkeypatch.setattr(server, "_hive_client", client)
+    assert _call(server.get_cluster_details, cluster_name="kappa")["cluster_namespace"] == "kappa-x6"
+
+
+@pytest.mark.parametrize("cluster_name, expected", [("ibm-two", "ibm-two"), ("IBM", "ibm-one")])
+def test_details_for_ibm_cluster(hive, cluster_name, expected):
+    details = _call(server.get_cluster_details, cluster_name=cluster_name)
+    assert details["name"] == expected
+    assert details["pool"] == "N/A (IBM - no pool)"
+    assert details["deployment"]["metadata"]["name"] == expected
+
+
+@pytest.mark.parametrize("cluster_name", ["missing", "al", "delta"])
+def test_details_not_found(hive, cluster_name):
+    assert _call(server.get_cluster_details, cluster_name=cluster_name) == {
+        "error": f"Cluster '{cluster_name}' not found",
+        "hint": "Try using list_all_clusters to see available clusters.",
+    }
+
+
+def test_name_indexes_reused_until_claims_change(hive):
+    indexes = server.get_name_indexes(hive)
+    again = server.get_name_indexes(hive)
+    assert all(a is b for a, b in zip(indexes[2:], again[2:]))
+    hive.refresh()
+    refreshed = server.get_name_indexes(hive)
+    assert refreshed[2] is not indexes[2]
+    assert refreshed[2].keys() == indexes[2].keys()
+
+
+@pytest.mark.parametrize("cluster_name, expected", [("alpha-x1", "alpha"), ("BETA-X2", "beta")])
+def test_details_by_cluster_namespace(hive, cluster_name, expected):
+    details = _call(server.get_cluster_details, cluster_name=cluster_name)
+    assert details["name"] == expected
+    assert details["deployment"]["metadata"]["namespace"] == cluster_name.lower()
+
+
+def test_details_by_cluster_namespace_prefix(monkeypatch):
+    client = FakeHiveClient(
+        [_claim("zeta-claim", "zeta-ns-abc12")],
+        [_deployment("zeta-ns-abc12", "zeta-ns-abc12")],
+    )
+    monkeypatch.setattr(server, "_hive_client", client)
+    assert _call(server.get_cluster_details, cluster_name="zeta-ns")["name"] == "zeta"
+
+
+def test_details_by_namespace_needs_a_deployment(hive):
+    # Namespace matches only count once the cluster has been provisioned
+    assert "error" in _call(server.get_cluster_details, cluster_name="gamma-x3")
+
+
+def test_namespace_index(hive):
+    _, _, _, claims_by_namespace, _ = server.get_name_indexes(hive)
+    assert {ns: claim["metadata"]["name"] for ns, claim in claims_by_namespace.items()} == {
+        "alpha-x1": "alpha-claim",
+        "beta-x2": "beta-claim",
+        "gamma-x3": "gamma-claim",
+    }
+
+
+def test_details_lookup_makes_no_api_calls_once_warm(monkeypatch):
+    objects = {
+        ("clusterclaims", "rhoai"): CLAIMS,
+        ("clusterdeployments", None): DEPLOYMENTS,
+    }
+    requests = []
+
+    def list_custom_objects(plural, namespace=None, metadata_only=False):
+        requests.append((plural, namespace))
+        return copy.deepcopy(objects.get((plural, namespace), []))
+
+    client = hive_client.HiveClusterClient(kubeconfig_path="unused", context="unused", cache_ttl=30, watch=False)
+    client._ready = True
+    monkeypatch.setattr(client, "_list_custom_objects", list_custom_objects)
+    monkeypatch.setattr(server, "_hive_client", client)
+
+    assert _call(server.get_cluster_details, cluster_name="alpha")["name"] == "alpha"
+    warm = len(requests)
+    for cluster_name in ("beta", "alpha-x1", "ibm-one", "missing"):
+        _call(server.get_cluster_details, cluster_name=cluster_name)
+    assert len(requests) == warm
+
+
+# --- Cluster-wide list vs namespaced fallback ---
+
+def _names(objects):
+    return [obj["metadata"]["name"] for obj in objects]
+
+
+def test_all_cluster_data_from_cluster_wide_list(hive):
+    clusterclaims, deployments_by_namespace, ibm_clusters = server.get_all_cluster_data(hive)
+    assert _names(clusterclaims) == _names(CLAIMS)
+    assert {ns: dep["metadata"]["name"] for ns, dep in deployments_by_namespace.items()} == {
+        "alpha-x1": "alpha-x1",
+        "beta-x2": "beta-x2",
+        "rhoai": "ibm-one",
+    }
+    # IBM clusters come out of the same list, without a separate rhoai list
+    assert _names(ibm_clusters) == ["ibm-one", "ibm-two"]
+    assert hive.calls == [("get_clusterclaims_and_deployments", "rhoai")]
+
+
+def test_all_cluster_data_falls_back_to_one_parallel_fanout(hive):
+    hive.cluster_wide = False
+    clusterclaims, deployments_by_namespace, ibm_clusters = server.get_all_cluster_data(hive)
+    assert {ns: dep["metadata"]["name"] for ns, dep in deployments_by_namespace.items()} == {
+        "alpha-x1": "alpha-x1",
+        "beta-x2": "beta-x2",
+        "rhoai": "ibm-one",
+    }
+    assert _names(ibm_clusters) == ["ibm-one", "ibm-two"]
+    # rhoai is listed in the same fan-out as the claim namespaces
+    assert hive.calls == [
+        ("get_clusterclaims_and_deployments", "rhoai"),
+        ("get_clusterdeployments_parallel", ["alpha-x1", "beta-x2", "gamma-x3", "", "rhoai"]),
+    ]
+
+
+def test_tools_agree_with_and_without_cluster_wide_access(monkeypatch):
+    results = []
+    for cluster_wide in (True, False):
+        monkeypatch.setattr(server, "_hive_client", FakeHiveClient(cluster_wide=cluster_wide))
+        monkeypatch.setattr(server, "_derived", {})
+        results.append((
+            _call(server.list_all_clusters, include_details=True),
+            _call(server.get_cluster_count_by_platform),
+            _call(server.get_cluster_count_by_state),
+        ))
+    assert results[0] == results[1]
+
+
+# --- Console URL ---
+
+@pytest.mark.parametrize("api_url, expected", [
+    ("https://api.my-cluster.aws.example.com:6443", "https://console-openshift-console.apps.my-cluster.aws.example.com"),
+    ("https://api.my-cluster.aws.example.com", "https://console-openshift-console.apps.my-cluster.aws.example.com"),
+    ("https://api.my-cluster.aws.example.com:6443/", "https://console-openshift-console.apps.my-cluster.aws.example.com"),
+    ("https://user@api.my-cluster.aws.example.com:6443", "https://console-openshift-console.apps.my-cluster.aws.example.com"),
+    # Hostnames are case-insensitive and come back lowercased
+    ("https://API.My-Cluster.Example.com:6443", "https://console-openshift-console.apps.my-cluster.example.com"),
+    ("N/A", "N/A"),
+    ("", "N/A"),
+    ("not a url", "N/A"),
+    ("https://[::1:6443", "N/A"),
+    # A single-label host has no cluster domain to derive from
+    ("https://localhost:6443", "N/A"),
+])
+def test_console_url_from_api(api_url, expected):
+    assert server._console_url_from_api(api_url) == expected